@@ -1,20 +1,14 @@
 """
 Main entry point for the Revit Warnings Manager application.
 """
-import sys
 import os
-
-# Add the 'src' directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
 import tkinter as tk
-from app import RevitManager
+from revit_warnings_manager.app import RevitManager
 import logging
 
-# Configure logging for verbose output
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
-
-logging.debug("Starting the Revit Warnings Manager application.")
+# Configure verbose console logging only when explicitly requested
+if os.getenv("REVIT_DEBUG"):
+    logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
 def main():
     logging.debug("Initializing the application.")
@@ -26,7 +20,7 @@ def main():
         root.mainloop()
         logging.debug("Application main loop started.")
     except Exception as e:
-        logging.error(f"An unexpected error occurred: {e}")
+        logging.error("An unexpected error occurred: %s", e)
         import traceback
         traceback.print_exc()
         input("Press ENTER to close...")
@@ -0,0 +1,43 @@
+"""
+Revit Warnings Manager package.
+
+This package provides tools for parsing Revit warning files, journal files,
+and managing UI for warnings analysis.
+
+Public names are resolved lazily on first attribute access, so importing the
+package does not pull in tkinter or the parsers until they are needed.
+"""
+import importlib
+
+# Maps each public name to the submodule that defines it
+_LAZY = {
+    'RevitManager': '.app',
+    'UIManager': '.ui',
+    'EventHandlers': '.handlers',
+    'FileOperations': '.file_operations',
+    'ErrorHandler': '.parsers',
+    'HTMLParser': '.parsers',
+    'JournalParser': '.parsers',
+    'JournalEntry': '.parsers',
+    'WorkerLogParser': '.parsers',
+    'WorkerLogEntry': '.parsers',
+    'JournalProblemFinder': '.parsers',
+}
+
+__all__ = list(_LAZY)
+
+__version__ = "1.0.0"
+
+
+def __getattr__(name):
+    """Import the submodule providing ``name`` on first access and cache it."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,112 @@
+"""
+This module contains the core application logic for the Revit Warnings Manager.
+"""
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import tkinter as tk
+from tkinter import ttk
+
+# Configure logging before the submodules are imported so their import-time
+# messages reach the file. Records are queued and written to disk by a
+# background listener thread.
+_log_queue = queue.SimpleQueue()
+_file_handler = logging.handlers.RotatingFileHandler("app.log", maxBytes=10 * 1024 * 1024,
+                                                     backupCount=3, encoding="utf-8")
+_file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger(__package__)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.setLevel(os.getenv("REVIT_LOG", "INFO").upper())
+logger.debug("Application started.")
+
+from .ui import UIManager
+from .handlers import EventHandlers
+from .file_operations import FileOperations
+
+# Resolve the window icon once at import time instead of per window
+_ICON_PATH = os.path.join(os.path.dirname(__file__), 'assets', 'icon.ico')
+_ICON_OK = os.path.exists(_ICON_PATH)
+if not _ICON_OK:
+    logger.warning("Icon file not found: %s", _ICON_PATH)
+
+class RevitManager:
+    """
+    The main application class that orchestrates the UI, event handling,
+    and file operations.
+    """
+    # Widgets and variables attached by UIManager.setup_ui()
+    tree: "ttk.Treeview | None" = None
+    status_filter: "ttk.Combobox | None" = None
+    search_var: "tk.StringVar | None" = None
+    search_entry: "ttk.Entry | None" = None
+    group_mode: "tk.BooleanVar | None" = None
+    group_checkbox: "ttk.Checkbutton | None" = None
+    warnings_info_label: "ttk.Label | None" = None
+    journals_tree: "ttk.Treeview | None" = None
+    journal_filter: "ttk.Combobox | None" = None
+    journal_search_var: "tk.StringVar | None" = None
+    time_range_var: "tk.StringVar | None" = None
+    filter_selected_model_var: "tk.BooleanVar | None" = None
+    header_vars: "dict | None" = None
+    model_selector: "ttk.Combobox | None" = None
+    journal_tree: "ttk.Treeview | None" = None
+    journal_info_label: "ttk.Label | None" = None
+    cleaning_tree: "ttk.Treeview | None" = None
+    cleaning_info_text: "tk.Text | None" = None
+    backup_before_clean: "tk.BooleanVar | None" = None
+    cleaning_status_label: "ttk.Label | None" = None
+
+    def __init__(self, root):
+        logger.debug("Initializing RevitManager.")
+        self.root = root
+        self.root.title("AEC.codes - Revit Resolution Tools")
+        self.root.geometry("1400x900")
+        
+        # Set window icon
+        if _ICON_OK:
+            try:
+                self.root.iconbitmap(_ICON_PATH)
+                logger.debug("Window icon set successfully: %s", _ICON_PATH)
+            except tk.TclError as e:
+                logger.error("Failed to set window icon: %s", e)
+
+        # Data holders
+        self.warnings_data = []
+        self.json_file_path = None
+        self.journal_problems = []
+        # Source rows currently shown in journal_tree, used by the journal export
+        self.journal_visible_rows = []
+        # Revit version -> cleanable areas of the scan shown in the cleaning tab
+        self.cleanable_data = {}
+
+        # Components are created once the event loop is running, so the
+        # root window can paint before the widget trees are built
+        self.ui = None
+        self.events = None
+        self.files = None
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.after_idle(self._deferred_init)
+
+    def _on_close(self):
+        """Stop the background file work, then close the window."""
+        if self.files is not None:
+            self.files.shutdown()
+        self.root.destroy()
+
+    def _deferred_init(self):
+        """Create the UI, event and file components and build the widgets."""
+        # Initialize components
+        self.ui = UIManager(self)
+        self.events = EventHandlers(self)
+        self.files = FileOperations(self)
+
+        # Setup UI
+        self.ui.setup_ui()
+        logger.debug("UI setup completed.")
+        assert self.tree is not None, "UI setup did not create the warnings tree"
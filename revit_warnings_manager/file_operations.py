@@ -0,0 +1,875 @@
+"""
+This module handles file loading and saving operations.
+"""
+import io
+import json
+import mmap
+import os
+import queue
+import re
+import threading
+from tkinter import filedialog
+from datetime import datetime
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from .parsers import HTMLParser, JournalParser, WorkerLogParser, JournalProblemFinder, ErrorHandler
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    # Fall back to the standard library, producing the same UTF-8 bytes
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# How often the Tk thread drains results posted by background work, in ms
+_UI_POLL_MS = 50
+
+# Per-version folder names under AppData\...\Autodesk\Revit, and journal file names
+_RE_REVIT_DIR = re.compile(r'Autodesk Revit')
+_RE_JOURNAL_FILE = re.compile(r'journal.*\.txt\Z', re.IGNORECASE | re.DOTALL)
+
+# Revit.ini keys counted by the cleaning scan: File{N}= (recent files) and Config{N}= (worksets)
+_RE_INI_COUNTED_KEY = re.compile(r'^(File|Config)\d+=', re.MULTILINE)
+
+# Units used by FileOperations._format_size, one per power of 1024
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Entries inside each Revit version folder that the cleaning scan reports on
+_CLEANABLE_ENTRIES = (
+    'Revit.ini', 'RecentFileCache', 'KeyboardShortcuts.xml', 'RevitUILayout.xml',
+    'MaterialUIConfig.xml', 'CefCache', 'CollaborationCache', 'Product Feedback'
+)
+
+# Fields of a cache folder area until the scan has walked the folder
+_UNSIZED_FOLDER = {'count': 0, 'size': 0, 'description': 'Calculating size...'}
+
+
+@lru_cache(maxsize=32)
+def _read_ini_content(ini_path, mtime_ns):
+    """Read a Revit.ini file once per modification time (mtime_ns is the cache key)."""
+    # Revit.ini is typically UTF-16 LE encoded; read the raw bytes and decode them once
+    with open(ini_path, 'rb') as f:
+        return f.read().decode('utf-16-le', 'ignore')
+
+class FileOperations:
+    """Handles all file loading, saving, and export operations."""
+    
+    def __init__(self, app_controller):
+        """Initialize FileOperations with a reference to the main application controller."""
+        self.app = app_controller
+        # (fingerprint, result) of the last scan_revit_cleanable_areas call
+        self._cleanable_cache = None
+        # Bumped by every journal / worker log load so the result of an older,
+        # slower load never replaces a newer one
+        self._journal_load_id = 0
+        self._worker_log_load_id = 0
+        # Blocking file work runs here so the Tk event loop stays responsive
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="revit-io")
+        self._pending_jobs = 0
+        # Worker threads never call Tk; they post (callback, args) here and the Tk
+        # thread drains the queue with an after() poll while work is pending
+        self._tk_calls = queue.SimpleQueue()
+        self._poll_after_id = None
+        # Set on shutdown so long folder walks stop early
+        self._closing = threading.Event()
+        logger.debug("FileOperations initialized")
+
+    def run_in_background(self, work, on_done, on_error=None):
+        """
+        Run work() on the I/O thread pool and pass its result to on_done() on the Tk thread.
+        
+        Args:
+            work (callable): Blocking function that must not touch any widget.
+            on_done (callable): Called with the result of work() from the Tk event loop.
+            on_error (callable): Called with the raised exception from the Tk event loop.
+        """
+        self._pending_jobs += 1
+        self.app.root.config(cursor="watch")
+        future = self._io_pool.submit(work)
+        if self._poll_after_id is None:
+            self._poll_after_id = self.app.root.after(_UI_POLL_MS, self._drain_tk_calls)
+
+        def finish():
+            self._pending_jobs -= 1
+            if not self._pending_jobs:
+                self.app.root.config(cursor="")
+            try:
+                result = future.result()
+            except Exception as e:
+                if on_error:
+                    on_error(e)
+                else:
+                    logger.error("Background task failed: %s", e, exc_info=e)
+                return
+            on_done(result)
+
+        # Only hand the final UI step back to the Tk thread
+        future.add_done_callback(lambda _: self._tk_calls.put((finish, ())))
+        return future
+
+    def call_in_tk(self, callback, *args):
+        """Queue callback(*args) to run on the Tk thread; safe to call from worker threads."""
+        self._tk_calls.put((callback, args))
+
+    def _drain_tk_calls(self):
+        """Run the callbacks posted by background work, polling again while work is pending."""
+        while True:
+            try:
+                callback, args = self._tk_calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error("Background task callback failed: %s", e, exc_info=e)
+        if self._pending_jobs:
+            self._poll_after_id = self.app.root.after(_UI_POLL_MS, self._drain_tk_calls)
+        else:
+            self._poll_after_id = None
+
+    def shutdown(self):
+        """Stop background work when the window closes, without waiting for running tasks."""
+        self._closing.set()
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+
+    def load_html(self):
+        """Load and parse an HTML warnings file from Revit."""
+        file_path = filedialog.askopenfilename(
+            title="Select Revit HTML file",
+            filetypes=[("HTML files", "*.html"), ("All files", "*.*")]
+        )
+        
+        if not file_path:
+            return
+
+        def work():
+            # Map the file instead of reading it into a decoded string first;
+            # the parser consumes it in a single sequential pass
+            with open(file_path, 'rb') as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    # An empty file cannot be mapped; it has no table either way
+                    return HTMLParser.parse(b"")
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as html_content:
+                    if hasattr(html_content, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        html_content.madvise(mmap.MADV_SEQUENTIAL)
+
+                    # Parse the HTML content
+                    return HTMLParser.parse(html_content)
+
+        def on_done(warnings_data):
+            try:
+                self.app.warnings_data = warnings_data
+
+                # Set default JSON save path
+                base_name = os.path.splitext(os.path.basename(file_path))[0]
+                self.app.json_file_path = os.path.join(os.path.dirname(file_path), f"{base_name}_warnings.json")
+
+                # Update UI
+                self.app.events.update_tree()
+                self.app.warnings_info_label.config(text=f"Loaded {len(self.app.warnings_data)} warnings from HTML")
+
+                # Auto-save as JSON
+                self.save_json()
+                logger.info("Successfully loaded and parsed HTML file with %s warnings", len(self.app.warnings_data))
+            except Exception as e:
+                on_error(e)
+
+        def on_error(e):
+            ErrorHandler.show_error("Error loading HTML", f"Error loading HTML file:\n{str(e)}")
+            logger.error("HTML loading error: %s", e, exc_info=e)
+
+        logger.info("Loading HTML file: %s", file_path)
+        self.app.warnings_info_label.config(text=f"Loading {os.path.basename(file_path)}...")
+        self.run_in_background(work, on_done, on_error)
+
+    def load_json(self):
+        """Load existing JSON file with warnings data."""
+        file_path = filedialog.askopenfilename(
+            title="Select JSON file for warnings",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        
+        if not file_path:
+            return
+
+        def work():
+            with open(file_path, 'rb') as file:
+                return _json_loads(file.read())
+
+        def on_done(warnings_data):
+            try:
+                self.app.warnings_data = warnings_data
+                self.app.json_file_path = file_path
+                self.app.events.update_tree()
+                self.app.warnings_info_label.config(text=f"Loaded {len(self.app.warnings_data)} warnings from JSON")
+                logger.info("Successfully loaded JSON file with %s warnings", len(self.app.warnings_data))
+            except Exception as e:
+                on_error(e)
+
+        def on_error(e):
+            ErrorHandler.show_error("Error", f"Error loading JSON file:\n{str(e)}")
+            logger.error("JSON loading error: %s", e, exc_info=e)
+
+        logger.info("Loading JSON file: %s", file_path)
+        self.app.warnings_info_label.config(text=f"Loading {os.path.basename(file_path)}...")
+        self.run_in_background(work, on_done, on_error)
+    
+    def save_json(self):
+        """Save warnings data in JSON format."""
+        if not self.app.warnings_data:
+            ErrorHandler.show_warning("Warning", "No data to save")
+            return
+        
+        if not self.app.json_file_path:
+            self.app.json_file_path = filedialog.asksaveasfilename(
+                title="Save JSON file",
+                defaultextension=".json",
+                filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            )
+        
+        if not self.app.json_file_path:
+            return
+        
+        try:
+            logger.info("Saving JSON file: %s", self.app.json_file_path)
+            # Serialize before opening so a failure cannot truncate the existing
+            # file, then hand the whole buffer to a single unbuffered write
+            data = _json_dumps(self.app.warnings_data)
+            with open(self.app.json_file_path, 'wb', buffering=0) as file:
+                view = memoryview(data)
+                while view:
+                    view = view[file.write(view):]
+            
+            self.app.warnings_info_label.config(text=f"JSON file saved: {os.path.basename(self.app.json_file_path)}")
+            logger.info("Successfully saved %s warnings to JSON", len(self.app.warnings_data))
+            
+        except Exception as e:
+            ErrorHandler.show_error("Error", f"Error saving JSON file:\n{str(e)}")
+            logger.error("JSON saving error: %s", e, exc_info=True)
+
+    def analyze_journal(self):
+        """Analyze a Revit journal file for potential problems."""
+        file_path = filedialog.askopenfilename(
+            title="Select Revit Journal file", 
+            filetypes=[("Journal files", "*.txt"), ("All files", "*.*")]
+        )
+        
+        if not file_path:
+            return
+        self.app.ui.ensure_tab("Journal")
+
+        def work():
+            # Stream the journal line by line; they can run to hundreds of MB
+            finder = JournalProblemFinder()
+            with open(file_path, 'rb', buffering=1 << 20) as file:
+                return finder.find_problems_stream(file)
+
+        def on_done(problems):
+            try:
+                self.app.journal_problems = problems
+                
+                # Update UI
+                self.app.events.update_journal_tree()
+                self.app.journal_info_label.config(text=f"Found {len(self.app.journal_problems)} potential problems.")
+                logger.info("Found %s problems in journal file", len(self.app.journal_problems))
+            except Exception as e:
+                on_error(e)
+
+        def on_error(e):
+            if isinstance(e, UnicodeDecodeError):
+                ErrorHandler.show_error("Error analyzing journal", f"Unicode decoding error: {e}")
+                logger.error("Journal analysis Unicode error: %s", e)
+            else:
+                ErrorHandler.show_error("Error analyzing journal", str(e))
+                logger.error("Journal analysis error: %s", e, exc_info=e)
+
+        logger.info("Analyzing journal file: %s", file_path)
+        self.app.journal_info_label.config(text=f"Analyzing {os.path.basename(file_path)}...")
+        self.run_in_background(work, on_done, on_error)
+    
+    def load_journal_file(self, file_path=None):
+        """Load and parse a Revit journal file with model information."""
+        if not file_path:
+            file_path = filedialog.askopenfilename(
+                title="Select Revit Journal file", 
+                filetypes=[("Journal files", "*.txt"), ("All files", "*.*")]
+            )
+        
+        if not file_path:
+            return
+        self.app.ui.ensure_tab("Journal")
+        self._journal_load_id += 1
+        load_id = self._journal_load_id
+
+        def work():
+            parser = JournalParser()
+            return parser.parse_journal_with_models(file_path)
+
+        def on_done(journal_data):
+            if load_id != self._journal_load_id:
+                logger.debug("Discarding superseded journal load: %s", file_path)
+                return
+            try:
+                self.app.journal_data = journal_data
+
+                if not self.app.journal_data or not isinstance(self.app.journal_data, dict):
+                    if self.app.journal_info_label is not None:
+                        self.app.journal_info_label.config(text="Failed to load journal file.")
+                    logger.error("Failed to load journal file: Invalid data format")
+                    return
+
+                # Update header information
+                if self.app.header_vars is not None:
+                    for key, var in self.app.header_vars.items():
+                        var.set(f"{key.capitalize()}: {self.app.journal_data.get('header', {}).get(key, 'Unknown')}")
+
+                # Update model selector
+                if self.app.model_selector is not None:
+                    self.app.model_selector['values'] = self.app.journal_data.get('models', [])
+                    self.app.model_selector.current(0)
+                    
+                    # Apply filter for "All models"
+                    if hasattr(self.app.events, 'filter_journal_by_model'):
+                        self.app.events.filter_journal_by_model("All models")
+
+                # Update UI
+                if self.app.journal_info_label is not None:
+                    self.app.journal_info_label.config(
+                        text=f"Loaded journal file: {os.path.basename(file_path)}"
+                    )
+
+                # Load worker log if available
+                worker_log_path = file_path.replace("journal", "worker1.log")
+                self.load_worker_log(worker_log_path)
+                
+                logger.info("Successfully loaded journal file with %s models", len(self.app.journal_data.get('models', []))-1)
+            except Exception as e:
+                on_error(e)
+
+        def on_error(e):
+            if load_id != self._journal_load_id:
+                logger.debug("Ignoring error of superseded journal load: %s", e)
+                return
+            ErrorHandler.show_error("Journal Loading Error", f"Failed to load journal file:\n{str(e)}")
+            logger.error("Journal loading error: %s", e, exc_info=e)
+
+        logger.info("Loading journal file: %s", file_path)
+        if self.app.journal_info_label is not None:
+            self.app.journal_info_label.config(text=f"Loading {os.path.basename(file_path)}...")
+        self.run_in_background(work, on_done, on_error)
+
+    def load_worker_log(self, file_path=None):
+        """Load and parse a Revit worker log file."""
+        if not file_path:
+            file_path = filedialog.askopenfilename(
+                title="Select Worker Log file", 
+                filetypes=[("Log files", "*.log"), ("All files", "*.*")]
+            )
+        
+        if not file_path or not os.path.exists(file_path):
+            logger.warning("Worker log file not found: %s", file_path)
+            return
+        self.app.ui.ensure_tab("Journal")
+        self._worker_log_load_id += 1
+        load_id = self._worker_log_load_id
+
+        def work():
+            parser = WorkerLogParser()
+            return parser.parse_worker_log(file_path)
+
+        def on_done(worker_log_data):
+            if load_id != self._worker_log_load_id:
+                logger.debug("Discarding superseded worker log load: %s", file_path)
+                return
+            try:
+                self.app.worker_log_data = worker_log_data
+
+                if not self.app.worker_log_data or not isinstance(self.app.worker_log_data, dict):
+                    if self.app.journal_info_label is not None:
+                        self.app.journal_info_label.config(text="Failed to load worker log file.")
+                    logger.error("Failed to load worker log file: Invalid data format")
+                    return
+
+                # Update worker log information
+                self.app.worker_log_entries = self.app.worker_log_data.get('entries', [])
+                
+                # Update UI
+                if hasattr(self.app.events, 'update_worker_log_view'):
+                    self.app.events.update_worker_log_view()
+                    
+                # Update info label
+                if self.app.journal_info_label is not None:
+                    current_text = self.app.journal_info_label.cget("text")
+                    self.app.journal_info_label.config(
+                        text=f"{current_text} | Worker log: {len(self.app.worker_log_entries)} entries"
+                    )
+                    
+                logger.info("Successfully loaded worker log with %s entries", len(self.app.worker_log_entries))
+            except Exception as e:
+                on_error(e)
+
+        def on_error(e):
+            if load_id != self._worker_log_load_id:
+                logger.debug("Ignoring error of superseded worker log load: %s", e)
+                return
+            ErrorHandler.show_error("Worker Log Error", f"Failed to load worker log file:\n{str(e)}")
+            logger.error("Worker log loading error: %s", e, exc_info=e)
+
+        logger.info("Loading worker log file: %s", file_path)
+        self.run_in_background(work, on_done, on_error)
+            
+    def scan_revit_journals(self):
+        """
+        Scan Revit AppData directories for journal files.
+        Returns a dictionary with Revit versions as keys and lists of (journal path,
+        modification time) pairs as values, newest first.
+        """
+        # Get the user's AppData directory
+        appdata_path = os.path.expanduser(r"~\AppData\Local\Autodesk\Revit")
+        
+        if not os.path.exists(appdata_path):
+            logger.warning("Revit AppData path not found: %s", appdata_path)
+            return {}
+        
+        journals_by_version = {}
+        
+        try:
+            # Scan for Revit version directories
+            for version_entry in self._dir_entries(appdata_path).values():
+                item = version_entry.name
+                
+                # Check the name first so unrelated entries are never stat'ed
+                if _RE_REVIT_DIR.match(item) and version_entry.is_dir():
+                    journals_dir = os.path.join(version_entry.path, "Journals")
+                    
+                    if os.path.isdir(journals_dir):
+                        # Find all journal .txt files, taking the mtime from the directory entry
+                        with os.scandir(journals_dir) as it:
+                            entries = [
+                                (entry.stat().st_mtime, entry.path) for entry in it
+                                if _RE_JOURNAL_FILE.match(entry.name) and entry.is_file()
+                            ]
+                        
+                        if entries:
+                            # Sort by modification time (newest first)
+                            entries.sort(reverse=True)
+                            journal_files = [(path, mtime) for mtime, path in entries]
+                            journals_by_version[item] = journal_files
+                            logger.debug("Found %s journals in %s", len(journal_files), item)
+            
+            logger.info("Scanned %s Revit versions with journals", len(journals_by_version))
+            return journals_by_version
+            
+        except Exception as e:
+            logger.error("Error scanning Revit journals: %s", e, exc_info=True)
+            return {}
+    
+    def scan_revit_cleanable_areas(self, on_progress=None):
+        """
+        Scan Revit AppData directories for cleanable areas.
+        Returns a dictionary with version info and cleanable areas with their sizes.
+        
+        Args:
+            on_progress (callable, optional): Called from the scanning thread as
+                on_progress(cleanable_by_version, None) once every area is known (cache
+                folders not sized yet), then as on_progress(cleanable_by_version, area)
+                each time a cache folder has been sized. Not called when the previous
+                scan is reused.
+        """
+        roaming_path = os.path.expanduser(r"~\AppData\Roaming\Autodesk\Revit")
+        local_path = os.path.expanduser(r"~\AppData\Local\Autodesk\Revit")
+        
+        # Reuse the previous scan when none of the scanned entries changed
+        fingerprint = self._cleanable_fingerprint((roaming_path, local_path))
+        if self._cleanable_cache and self._cleanable_cache[0] == fingerprint:
+            logger.debug("Cleanable areas unchanged, reusing previous scan")
+            return self._cleanable_cache[1]
+        
+        cleanable_by_version = {}
+        # (area, description template) pairs whose folder size is computed after the scan
+        folders_to_size = []
+        
+        try:
+            # Get all Revit versions from both directories
+            roaming_versions = {
+                entry.name for entry in self._dir_entries(roaming_path).values()
+                if _RE_REVIT_DIR.match(entry.name) and entry.is_dir()
+            }
+            local_versions = {
+                entry.name for entry in self._dir_entries(local_path).values()
+                if _RE_REVIT_DIR.match(entry.name) and entry.is_dir()
+            }
+            
+            # For each version, scan cleanable areas
+            for version in sorted(roaming_versions | local_versions):
+                roaming_version_path = os.path.join(roaming_path, version)
+                local_version_path = os.path.join(local_path, version)
+                
+                cleanable_areas = []
+                
+                # ROAMING areas
+                if version in roaming_versions:
+                    # One listing of the version folder answers every existence check below
+                    entries = self._dir_entries(roaming_version_path)
+                    
+                    # 1. Recent Files (from Revit.ini)
+                    ini_path = os.path.join(roaming_version_path, "Revit.ini")
+                    ini_stat = self._entry_stat(entries.get(os.path.normcase("Revit.ini")))
+                    ini_mtime = ini_stat.st_mtime_ns if ini_stat else None
+                    if ini_mtime is not None:
+                        recent_count, workset_count = self._count_ini_entries(ini_path, ini_mtime)
+                        cleanable_areas.append({
+                            'name': 'Recent Files',
+                            'type': 'ini_section',
+                            'path': ini_path,
+                            'count': recent_count,
+                            'size': 0,  # No actual files, just ini entries
+                            'description': f'{recent_count} recent file entries in Revit.ini'
+                        })
+                    
+                    # 2. Recent File Cache
+                    cache_path = os.path.join(roaming_version_path, "RecentFileCache")
+                    if os.path.normcase("RecentFileCache") in entries:
+                        area = {
+                            'name': 'Recent File Cache',
+                            'type': 'folder',
+                            'path': cache_path,
+                            **_UNSIZED_FOLDER
+                        }
+                        cleanable_areas.append(area)
+                        folders_to_size.append((area, '{count} cached files, {size}'))
+                    
+                    # 3. Workset Configurations (from Revit.ini)
+                    if ini_mtime is not None:
+                        cleanable_areas.append({
+                            'name': 'Workset Configurations',
+                            'type': 'ini_section',
+                            'path': ini_path,
+                            'count': workset_count,
+                            'size': 0,
+                            'description': f'{workset_count} workset configurations in Revit.ini'
+                        })
+                    
+                    # 4. UI Configuration Files
+                    ui_files = []
+                    total_size = 0
+                    for ui_file in ['KeyboardShortcuts.xml', 'RevitUILayout.xml', 'MaterialUIConfig.xml']:
+                        ui_stat = self._entry_stat(entries.get(os.path.normcase(ui_file)))
+                        if ui_stat:
+                            ui_files.append(os.path.join(roaming_version_path, ui_file))
+                            total_size += ui_stat.st_size
+                    
+                    if ui_files:
+                        cleanable_areas.append({
+                            'name': 'UI Configuration Files',
+                            'type': 'files',
+                            'path': roaming_version_path,
+                            'files': ui_files,
+                            'count': len(ui_files),
+                            'size': total_size,
+                            'description': f'{len(ui_files)} UI config files, {self._format_size(total_size)}'
+                        })
+                
+                # LOCAL areas
+                if version in local_versions:
+                    entries = self._dir_entries(local_version_path)
+                    
+                    # 5. CefCache
+                    cef_path = os.path.join(local_version_path, "CefCache")
+                    if os.path.normcase("CefCache") in entries:
+                        area = {
+                            'name': 'CefCache',
+                            'type': 'folder',
+                            'path': cef_path,
+                            **_UNSIZED_FOLDER
+                        }
+                        cleanable_areas.append(area)
+                        folders_to_size.append((area, 'Chrome cache: {count} files, {size}'))
+                    
+                    # 6. CollaborationCache
+                    collab_path = os.path.join(local_version_path, "CollaborationCache")
+                    if os.path.normcase("CollaborationCache") in entries:
+                        area = {
+                            'name': 'CollaborationCache',
+                            'type': 'folder',
+                            'path': collab_path,
+                            **_UNSIZED_FOLDER
+                        }
+                        cleanable_areas.append(area)
+                        folders_to_size.append((area, 'Collaboration cache: {count} files, {size}'))
+                    
+                    # 7. Product Feedback
+                    feedback_path = os.path.join(local_version_path, "Product Feedback")
+                    if os.path.normcase("Product Feedback") in entries:
+                        area = {
+                            'name': 'Product Feedback',
+                            'type': 'folder',
+                            'path': feedback_path,
+                            **_UNSIZED_FOLDER
+                        }
+                        cleanable_areas.append(area)
+                        folders_to_size.append((area, 'Feedback data: {count} files, {size}'))
+                
+                if cleanable_areas:
+                    cleanable_by_version[version] = cleanable_areas
+                    logger.debug("Found %s cleanable areas in %s", len(cleanable_areas), version)
+            
+            if on_progress:
+                on_progress(cleanable_by_version, None)
+            
+            # Size all cache folders concurrently; the walks are I/O-bound and independent
+            if folders_to_size:
+                with ThreadPoolExecutor(max_workers=min(16, len(folders_to_size))) as executor:
+                    futures = {
+                        executor.submit(self._get_folder_size, area['path']): (area, description)
+                        for area, description in folders_to_size
+                    }
+                    # Report each folder as soon as its walk finishes
+                    for future in as_completed(futures):
+                        area, description = futures[future]
+                        size, count = future.result()
+                        area['count'] = count
+                        area['size'] = size
+                        area['description'] = description.format(count=count, size=self._format_size(size))
+                        if on_progress:
+                            on_progress(cleanable_by_version, area)
+            
+            logger.info("Scanned %s Revit versions for cleaning", len(cleanable_by_version))
+            self._cleanable_cache = (fingerprint, cleanable_by_version)
+            return cleanable_by_version
+            
+        except Exception as e:
+            logger.error("Error scanning cleanable areas: %s", e, exc_info=True)
+            return {}
+    
+    @staticmethod
+    def _dir_entries(path):
+        """
+        List a directory once with scandir.
+        
+        Returns:
+            dict: DirEntry objects keyed by os.path.normcase(name), so lookups follow
+            the platform's case rules; empty if the directory cannot be read.
+        """
+        try:
+            with os.scandir(path) as it:
+                return {os.path.normcase(entry.name): entry for entry in it}
+        except OSError:
+            return {}
+
+    @staticmethod
+    def _entry_stat(entry):
+        """Return the (cached) stat result of a DirEntry, or None if it is missing or unreadable."""
+        if entry is None:
+            return None
+        try:
+            return entry.stat()
+        except OSError:
+            return None
+
+    def _cleanable_fingerprint(self, base_paths):
+        """
+        Build a cheap fingerprint of the cleanable areas from the modification
+        times of the base folders, the version folders and their cleanable entries.
+        """
+        fingerprint = []
+        for base_path in base_paths:
+            try:
+                fingerprint.append((base_path, os.stat(base_path).st_mtime_ns))
+                with os.scandir(base_path) as it:
+                    for entry in it:
+                        if not _RE_REVIT_DIR.match(entry.name) or not entry.is_dir():
+                            continue
+                        fingerprint.append((entry.path, entry.stat().st_mtime_ns))
+                        for name in _CLEANABLE_ENTRIES:
+                            try:
+                                mtime = os.stat(os.path.join(entry.path, name)).st_mtime_ns
+                            except OSError:
+                                mtime = None
+                            fingerprint.append((name, mtime))
+            except OSError:
+                fingerprint.append((base_path, None))
+        return tuple(fingerprint)
+    
+    def invalidate_cleanable_cache(self):
+        """Force the next scan_revit_cleanable_areas call to rescan the disk."""
+        self._cleanable_cache = None
+    
+    def _get_folder_size(self, folder_path):
+        """Calculate total size and file count of a folder."""
+        total_size = 0
+        file_count = 0
+        
+        try:
+            # Walk with scandir so sizes come from the directory entries
+            # (free on Windows) instead of one extra stat() per file
+            stack = [folder_path]
+            while stack and not self._closing.is_set():
+                current = stack.pop()
+                try:
+                    with os.scandir(current) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    stack.append(entry.path)
+                                else:
+                                    total_size += entry.stat(follow_symlinks=False).st_size
+                                    file_count += 1
+                            except OSError:
+                                pass
+                except OSError:
+                    pass
+        except Exception as e:
+            logger.warning("Error calculating folder size for %s: %s", folder_path, e)
+        
+        return total_size, file_count
+    
+    def _format_size(self, size_bytes):
+        """Format bytes to human-readable size."""
+        # Each unit step is 10 bits, so the bit length selects the unit directly
+        index = 0 if size_bytes < 1024 else min(4, (size_bytes.bit_length() - 1) // 10)
+        return f"{size_bytes / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
+    
+    def _count_ini_entries(self, ini_path, mtime_ns):
+        """
+        Count recent file and workset configuration entries in Revit.ini in one pass.
+        
+        Returns:
+            tuple: (recent file count, workset configuration count).
+        """
+        try:
+            content = _read_ini_content(ini_path, mtime_ns)
+            # Count ALL File{N}= and Config{N}= entries (don't break on gaps)
+            keys = _RE_INI_COUNTED_KEY.findall(content)
+            recent_count = keys.count('File')
+            workset_count = len(keys) - recent_count
+            logger.debug("Found %s recent files and %s workset configs in %s", recent_count, workset_count, ini_path)
+            return recent_count, workset_count
+        except Exception as e:
+            logger.warning("Error counting Revit.ini entries in %s: %s", ini_path, e)
+            return 0, 0
+    
+    def load_file(self):
+        """Open a file dialog to load a journal or worker log file."""
+        from tkinter import filedialog
+
+        file_path = filedialog.askopenfilename(
+            title="Select a File",
+            filetypes=[
+                ("Text Files", "*.txt"),
+                ("Log Files", "*.log"),
+                ("All Files", "*.*")
+            ]
+        )
+        if file_path:
+            if file_path.endswith(".txt"):
+                self.load_journal_file(file_path)
+            elif file_path.endswith(".log"):
+                self.load_worker_log(file_path)
+            else:
+                logger.warning("Unsupported file type: %s", file_path)
+
+    def export_journal_filtered(self):
+        """Export currently filtered journal entries to a text file."""
+        if not hasattr(self.app, 'journal_data') or not self.app.journal_data:
+            ErrorHandler.show_warning("Warning", "No journal data to export")
+            return
+        
+        # Get currently visible items from the rows mirrored by the journal views
+        visible_items = self.app.journal_visible_rows
+        
+        if not visible_items:
+            ErrorHandler.show_warning("Warning", "No entries to export")
+            return
+        
+        # Ask for save location
+        file_path = filedialog.asksaveasfilename(
+            title="Export Filtered Journal",
+            defaultextension=".txt",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+        )
+        
+        if not file_path:
+            return
+        
+        try:
+            logger.info("Exporting filtered journal to: %s", file_path)
+            # Build the whole export in memory and write it in one call
+            buf = io.StringIO()
+
+            # Include export timestamp
+            buf.write(f"# Journal Export - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            
+            # Include model information
+            if hasattr(self.app, 'journal_models') and self.app.journal_models:
+                buf.write(f"# Models found in journal: {len(self.app.journal_models)}\n")
+                for i, model in enumerate(self.app.journal_models):
+                    model_path = model.get("path", "Unknown")
+                    model_server = model.get("server", "Unknown")
+                    model_username = model.get("username", "Unknown")
+                    buf.write(f"# Model {i+1}: {model_path}\n")
+                    buf.write(f"#    Server: {model_server}\n")
+                    buf.write(f"#    User: {model_username}\n")
+            
+            # Include filter information
+            buf.write(f"# Filtered by:\n")
+            if self.app.journal_filter is not None:
+                buf.write(f"#    Category: {self.app.journal_filter.get()}\n")
+            
+            if self.app.journal_search_var is not None and self.app.journal_search_var.get():
+                buf.write(f"#    Search: \"{self.app.journal_search_var.get()}\"\n")
+            
+            if self.app.time_range_var is not None and self.app.time_range_var.get() != "All":
+                buf.write(f"#    Time Range: {self.app.time_range_var.get()}\n")
+                
+            if self.app.filter_selected_model_var is not None and self.app.filter_selected_model_var.get():
+                selected_index = self.app.model_selector.current()
+                if hasattr(self.app, 'journal_models') and selected_index >= 0 and selected_index < len(self.app.journal_models):
+                    model_path = self.app.journal_models[selected_index].get("path", "Unknown")
+                    buf.write(f"#    Model: {model_path}\n")
+            
+            # Include statistics
+            if hasattr(self.app.events, 'get_journal_category_stats'):
+                category_stats = self.app.events.get_journal_category_stats()
+                if category_stats:
+                    buf.write("\n# JOURNAL STATISTICS\n")
+                    for category, count in category_stats.items():
+                        buf.write(f"#    {category}: {count} entries\n")
+            
+            buf.write("\n# JOURNAL ENTRIES\n")
+            buf.write("=" * 80 + "\n\n")
+            buf.write(f"# Filtered Journal Export - {datetime.now()}\n")
+            buf.write(f"# Total entries: {len(visible_items)}\n\n")
+            
+            lines = [
+                f"[{e['timestamp']}] [{e['category']}]"
+                + (f" [{e['command']}]" if e.get('command') else "")
+                + f": {e.get('content') or ''}"
+                if e.get('timestamp') and e.get('category') else (e.get('content') or "")
+                for e in visible_items
+            ]
+            buf.write("\n".join(lines))
+            buf.write("\n")
+            
+            with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as out:
+                out.write(buf.getvalue())
+            
+            if self.app.journal_info_label is not None:
+                self.app.journal_info_label.config(text=f"Exported {len(visible_items)} entries to {os.path.basename(file_path)}")
+            logger.info("Successfully exported %s journal entries", len(visible_items))
+            
+        except Exception as e:
+            ErrorHandler.show_error("Export Error", f"Failed to export journal data:\n{str(e)}")
+            logger.error("Journal export error: %s", e, exc_info=True)
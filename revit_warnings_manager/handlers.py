@@ -0,0 +1,983 @@
+"""
+This module contains event handlers for the UI.
+"""
+from collections import Counter, defaultdict
+import tkinter as tk
+from tkinter import ttk
+from datetime import datetime, timedelta
+from itertools import chain
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Warning statuses from most to least urgent; a group takes its most urgent member's status
+_STATUS_ORDER = ("Open", "In Review", "Close")
+
+# Treeview tags used to colour rows by warning status
+_STATUS_TAGS = {"Open": ("open",), "In Review": ("in_review",), "Close": ("close",)}
+
+# Pause in typing (ms) before a search box change rebuilds its tree
+_SEARCH_DEBOUNCE_MS = 200
+
+class EventHandlers:
+    """
+    Handles all UI events and updates for the application.
+    Contains methods for filtering, tree manipulation, and context menus.
+    """
+    def __init__(self, app_controller):
+        """Initialize with reference to the main app controller."""
+        self.app = app_controller
+        # Pending root.after() ids of the debounced search filters
+        self._filter_after_id = None
+        self._journal_filter_after_id = None
+        # warnings_data entries and their lowercased messages keyed by "index";
+        # rebuilt only when warnings_data is replaced (see _index_warnings)
+        self._indexed_warnings = None
+        self._warning_by_index = {}
+        self._message_lc_by_index = {}
+        # Distinct lowercased messages; many warnings share a message, so the
+        # search text is matched once per message instead of once per warning
+        self._distinct_messages_lc = ()
+        # Lowercased journal line contents, aligned with journal_data['lines']
+        self._lowercased_lines = None
+        self._content_lc = []
+        # Journal tree item id -> entry shown in that row (see _fill_journal_tree)
+        self._journal_entry_by_item = {}
+        # Group parent item id -> currently visible warnings in that group
+        self._group_by_item = {}
+        # The warnings tree holds one node per warning, built once per dataset and
+        # view mode; filter changes only re-link the visible nodes (see update_tree)
+        self._tree_data = None
+        self._tree_grouped = None
+        self._item_by_warning = {}
+        self._parent_by_message = {}
+        self._children_by_parent = {}
+        # Group parent item id -> (placeholder child, all warnings of the group) for
+        # groups whose rows are inserted on first expansion (see _load_group_children)
+        self._unloaded_groups = {}
+        # Widgets of the journal problem details window, built on first use and
+        # hidden instead of destroyed (see _problem_details_window)
+        self._problem_details = None
+        # Same for the journal entry detail window (see _journal_entry_window)
+        self._journal_entry_details = None
+        logger.debug("EventHandlers initialized")
+
+    def schedule_filter(self, *args):
+        """Re-apply the warnings filters once typing in the search box pauses."""
+        if self._filter_after_id:
+            self.app.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.app.root.after(_SEARCH_DEBOUNCE_MS, self.apply_filter)
+
+    def schedule_journal_filter(self, *args):
+        """Re-apply the journal filters once typing in the search box pauses."""
+        if self._journal_filter_after_id:
+            self.app.root.after_cancel(self._journal_filter_after_id)
+        self._journal_filter_after_id = self.app.root.after(_SEARCH_DEBOUNCE_MS, self.apply_journal_filter)
+
+    def apply_filter(self, *args):
+        """Apply filters to the warnings tree (warnings tab)."""
+        # A direct call supersedes any rebuild still waiting on the search debounce
+        if self._filter_after_id:
+            self.app.root.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+        logger.debug("Applying filters to warnings tree")
+        self.update_tree()
+
+    def on_model_selected_event(self, event):
+        """Handle model selection and filter journal entries."""
+        selected_model = self.app.model_selector.get()
+        self.filter_journal_by_model(selected_model)
+
+    def filter_journal_by_model(self, selected_model):
+        """Filter journal entries by selected model."""
+        # Clear the treeview
+        self._clear_journal_tree()
+        
+        if not hasattr(self.app, 'journal_data') or not self.app.journal_data:
+            return
+
+        # Get all entries
+        entries = self.app.journal_data.get('lines', [])
+        
+        # Filter by model if not "All models"
+        if selected_model and selected_model != "All models":
+            filtered_entries = [entry for entry in entries if entry.get('model') == selected_model]
+        else:
+            filtered_entries = entries
+        self.app.journal_visible_rows = filtered_entries
+
+        # Populate the tree with filtered entries
+        self._fill_journal_tree(self._journal_rows(filtered_entries), filtered_entries)
+
+    @staticmethod
+    def _journal_rows(entries):
+        """Build the (timestamp, category, truncated content) values of journal entries."""
+        # 'content_short' is truncated by the journal parser when the file is loaded
+        return [
+            (
+                entry.get('timestamp', 'N/A'),
+                entry.get('category', 'Unknown'),
+                entry.get('content_short', '')
+            )
+            for entry in entries
+        ]
+
+    def _clear_journal_tree(self):
+        """Remove every row from the journal tree and forget the entries behind them."""
+        self.app.journal_tree.delete(*self.app.journal_tree.get_children())
+        self.app.journal_visible_rows = []
+        self._journal_entry_by_item = {}
+
+    def _fill_journal_tree(self, rows, entries):
+        """Append prepared row values to the journal tree, remembering the entry behind each row."""
+        insert = self.app.journal_tree.insert
+        entry_by_item = self._journal_entry_by_item
+        for values, entry in zip(rows, entries):
+            entry_by_item[insert("", tk.END, values=values)] = entry
+
+    def toggle_group_mode(self):
+        """Toggle between grouped view and flat list."""
+        logger.debug("Toggling group mode: %s", self.app.group_mode.get())
+        self.update_tree()
+
+    def expand_all(self):
+        """Expand all nodes in the tree."""
+        logger.debug("Expanding all tree nodes")
+        self._set_all_open(True)
+
+    def collapse_all(self):
+        """Collapse all nodes in the tree."""
+        logger.debug("Collapsing all tree nodes")
+        self._set_all_open(False)
+
+    def _set_all_open(self, is_open):
+        """Open or close every node that has children, walking the tree with an explicit stack."""
+        tree = self.app.tree
+        stack = list(tree.get_children())
+        while stack:
+            item = stack.pop()
+            if is_open and item in self._unloaded_groups:
+                self._load_group_children(item)
+            children = tree.get_children(item)
+            # Leaves have nothing to show or hide, so skip the Tcl call
+            if children:
+                tree.item(item, open=is_open)
+                stack.extend(children)
+
+    def on_tree_right_click(self, event):
+        """Handle right click to copy IDs."""
+        item = self.app.tree.identify_row(event.y)
+        if not item:
+            return
+            
+        self.app.tree.selection_set(item)
+        warning_or_group = self.get_warning_from_tree_item(item)
+        
+        if warning_or_group:
+            if isinstance(warning_or_group, list):
+                # It's a group of warnings
+                all_ids = self.get_all_ids_from_group(warning_or_group)
+                if all_ids:
+                    ids_string = ", ".join(all_ids)
+                    self.app.root.clipboard_clear()
+                    self.app.root.clipboard_append(ids_string)
+                    self.app.warnings_info_label.config(text=f"Group IDs copied ({len(all_ids)}): {ids_string[:50]}...")
+                    logger.info("Copied %s IDs from group to clipboard", len(all_ids))
+            else:
+                # It's a single warning
+                if warning_or_group["ids"]:
+                    ids_string = ", ".join(warning_or_group["ids"])
+                    self.app.root.clipboard_clear()
+                    self.app.root.clipboard_append(ids_string)
+                    self.app.warnings_info_label.config(text=f"IDs copied: {ids_string}")
+                    logger.info("Copied IDs to clipboard: %s", ids_string)
+
+    def on_tree_double_click(self, event):
+        """Handle double click on treeview to manage statuses."""
+        selection = self.app.tree.selection()
+        if not selection:
+            return
+            
+        item = selection[0]
+        warning_or_group = self.get_warning_from_tree_item(item)
+        
+        if warning_or_group:
+            if isinstance(warning_or_group, list):
+                # It's a group - show group details
+                self.show_group_details(warning_or_group)
+            else:
+                # It's a single warning - show details and status management
+                self.show_warning_details(warning_or_group)
+    
+    def update_tree(self):
+        """Update the warnings treeview with filtered data."""
+        logger.debug("Updating warnings tree")
+        
+        if not hasattr(self.app, 'warnings_data') or not self.app.warnings_data:
+            self._clear_tree()
+            logger.warning("No warnings data to display")
+            return
+            
+        # Apply filters
+        filtered_data = self.get_filtered_data()
+        grouped = bool(self.app.group_mode is not None and self.app.group_mode.get())
+        
+        # Insert every warning only when the data or the view mode changed
+        if self._tree_data is not self.app.warnings_data or self._tree_grouped != grouped:
+            self._clear_tree()
+            if grouped:
+                self.populate_tree_grouped(self.app.warnings_data)
+            else:
+                self.populate_tree_flat(self.app.warnings_data)
+            self._tree_data = self.app.warnings_data
+            self._tree_grouped = grouped
+        
+        if grouped:
+            self._show_grouped(filtered_data)
+        else:
+            self._show_flat(filtered_data)
+            
+        logger.info("Tree updated with %s warnings", len(filtered_data))
+    
+    def refresh_warning_row(self, warning):
+        """Update the status column and colour of a warning's row in place after its status changed."""
+        item = self._item_by_warning.get(id(warning))
+        if item is None:
+            # Its group was never expanded; the row is built with the new status on first expansion
+            return
+        self.app.tree.item(item, tags=self.get_status_tags(warning["status"]))
+        self.app.tree.set(item, "Status", warning["status"])
+    
+    def _clear_tree(self):
+        """Delete every node of the warnings tree, including the ones hidden by the filters."""
+        tree = self.app.tree
+        # Detached nodes are not returned by get_children(), so link them back first
+        if self._children_by_parent:
+            for parent, children in self._children_by_parent.items():
+                tree.set_children(parent, *children)
+            tree.set_children("", *self._children_by_parent)
+        elif self._item_by_warning:
+            tree.set_children("", *self._item_by_warning.values())
+        tree.delete(*tree.get_children())
+        
+        self._tree_data = None
+        self._item_by_warning = {}
+        self._parent_by_message = {}
+        self._children_by_parent = {}
+        self._group_by_item = {}
+        self._unloaded_groups = {}
+    
+    def _show_flat(self, filtered_data):
+        """Attach exactly the filtered warnings, in order, with a single Tcl call."""
+        item_by_warning = self._item_by_warning
+        self.app.tree.set_children("", *[item_by_warning[id(w)] for w in filtered_data])
+    
+    def _show_grouped(self, filtered_data):
+        """Attach the groups and members that pass the filters and refresh the group summaries."""
+        tree = self.app.tree
+        item_by_warning = self._item_by_warning
+        visible_parents = []
+        for message, warnings_group in self.group_warnings_by_message(filtered_data).items():
+            parent = self._parent_by_message[message]
+            values, tags = self._group_row(warnings_group)
+            tree.item(parent, values=values, tags=tags)
+            # Unexpanded groups keep their placeholder row until they are opened
+            if parent not in self._unloaded_groups:
+                tree.set_children(parent, *[item_by_warning[id(w)] for w in warnings_group])
+            self._group_by_item[parent] = warnings_group
+            visible_parents.append(parent)
+        tree.set_children("", *visible_parents)
+    
+    def _group_row(self, warnings_group):
+        """Return the (values, tags) of a group parent row summarizing warnings_group."""
+        group_status, status_summary = self.get_group_status_summary(warnings_group)
+        # Only the number of IDs is shown, so count them without building the list
+        id_count = sum(len(warning["ids"]) for warning in warnings_group)
+        values = (
+            len(warnings_group),
+            status_summary,
+            f"Group: {len(warnings_group)} warning(s)",
+            f"{id_count} ID(s)"
+        )
+        return values, self.get_status_tags(group_status)
+        
+    def _index_warnings(self):
+        """Index warnings_data by "index" (for tree clicks) and cache lowercased messages (for search)."""
+        if self._indexed_warnings is self.app.warnings_data:
+            return
+        self._warning_by_index = {w["index"]: w for w in self.app.warnings_data}
+        # Warnings with the same message share one lowercased string
+        lc_by_message = {}
+        message_lc_by_index = {}
+        for w in self.app.warnings_data:
+            message = w["message"]
+            message_lc = lc_by_message.get(message)
+            if message_lc is None:
+                message_lc = lc_by_message[message] = message.lower()
+            message_lc_by_index[w["index"]] = message_lc
+        self._message_lc_by_index = message_lc_by_index
+        self._distinct_messages_lc = tuple(set(lc_by_message.values()))
+        self._indexed_warnings = self.app.warnings_data
+
+    def _journal_contents_lowercased(self, entries):
+        """Return the lowercased content of each journal entry, computed once per loaded journal."""
+        if self._lowercased_lines is not entries:
+            self._content_lc = [entry.get("content", "").lower() for entry in entries]
+            self._lowercased_lines = entries
+        return self._content_lc
+
+    def get_filtered_data(self):
+        """Apply filters to the warnings data."""
+        if not hasattr(self.app, 'warnings_data') or not self.app.warnings_data:
+            return []
+            
+        self._index_warnings()
+        status_filter = self.app.status_filter.get() if self.app.status_filter is not None else "All"
+        search_text = self.app.search_var.get().lower() if self.app.search_var is not None else ""
+        
+        # Status and search filters in a single pass
+        if status_filter == "All" and not search_text:
+            filtered = self.app.warnings_data
+        else:
+            message_lc = self._message_lc_by_index
+            # Search each distinct message once; warnings then only need a set lookup
+            matching = {lc for lc in self._distinct_messages_lc if search_text in lc} if search_text else None
+            filtered = [
+                w for w in self.app.warnings_data
+                if (status_filter == "All" or w["status"] == status_filter)
+                and (matching is None or message_lc[w["index"]] in matching)
+            ]
+        
+        return filtered
+        
+    def group_warnings_by_message(self, warnings):
+        """Group warnings by error message."""
+        groups = defaultdict(list)
+        for warning in warnings:
+            groups[warning["message"]].append(warning)
+        return dict(groups)
+    
+    def get_group_status_summary(self, warnings_group):
+        """Calculate status summary for a group."""
+        status_counts = Counter(warning["status"] for warning in warnings_group)
+        # Statuses present in the group, most urgent first
+        present = [(status, status_counts[status]) for status in _STATUS_ORDER if status_counts[status]]
+        
+        main_status = present[0][0] if present else "Close"
+        return main_status, " | ".join(f"{status}: {count}" for status, count in present)
+    
+    def get_all_ids_from_group(self, warnings_group):
+        """Get all IDs from a group of warnings."""
+        return list(chain.from_iterable(warning["ids"] for warning in warnings_group))
+    
+    def get_status_tags(self, status):
+        """Return tags for color coding based on status."""
+        return _STATUS_TAGS.get(status, ())
+        
+    def get_warning_from_tree_item(self, item):
+        """Get the warning associated with a tree item."""
+        if self.app.tree is None:
+            return None
+            
+        values = self.app.tree.item(item, "values")
+        if not values:
+            return None
+        
+        # If it's a group, return all warnings in the group
+        if self.app.group_mode is not None and self.app.group_mode.get() and not self.app.tree.parent(item):
+            # It's a parent node (group)
+            return self._group_by_item.get(item)
+        else:
+            # It's a single warning
+            try:
+                index = int(values[0])
+                return self._warning_by_index.get(index)
+            except (ValueError, IndexError):
+                return None
+    
+    def populate_tree_grouped(self, filtered_data):
+        """Populate the tree with grouped view."""
+        if self.app.tree is None:
+            return
+            
+        grouped = self.group_warnings_by_message(filtered_data)
+        insert = self.app.tree.insert
+        
+        for message, warnings_group in grouped.items():
+            # Group statistics and color based on group status
+            group_values, group_tags = self._group_row(warnings_group)
+            
+            # Insert parent node (group)
+            parent_text = f"{message[:80]}{'...' if len(message) > 80 else ''}"
+            parent = insert("", "end", text=parent_text, values=group_values, tags=group_tags, open=False)
+            self._group_by_item[parent] = warnings_group
+            self._parent_by_message[message] = parent
+            
+            # Groups start collapsed, so their warnings are inserted on first expansion;
+            # the placeholder child keeps the expand indicator visible until then
+            placeholder = insert(parent, "end", text="Loading...")
+            self._children_by_parent[parent] = [placeholder]
+            self._unloaded_groups[parent] = (placeholder, warnings_group)
+    
+    def on_tree_open(self, event):
+        """Insert the warnings of a group the first time it is expanded."""
+        self._load_group_children(self.app.tree.focus())
+    
+    def _load_group_children(self, parent):
+        """Replace the placeholder of a not yet expanded group with its warning rows."""
+        pending = self._unloaded_groups.pop(parent, None)
+        if pending is None:
+            return
+        placeholder, warnings_group = pending
+        
+        tree = self.app.tree
+        # Bind the per-row lookups once; this loop runs for every warning of the group
+        insert = tree.insert
+        get_tags = _STATUS_TAGS.get
+        item_by_warning = self._item_by_warning
+        children = []
+        add_child = children.append
+        
+        # Insert children (individual warnings); they all share the group message
+        message = warnings_group[0]["message"]
+        child_message = message[:100] + ("..." if len(message) > 100 else "")
+        for warning in warnings_group:
+            item = insert(parent, "end", text=f"Warning #{warning['index']}", values=(
+                warning["index"],
+                warning["status"],
+                child_message,
+                ", ".join(warning["ids"])
+            ), tags=get_tags(warning["status"], ()))
+            item_by_warning[id(warning)] = item
+            add_child(item)
+        
+        tree.delete(placeholder)
+        self._children_by_parent[parent] = children
+        # Show only the members that pass the current filters
+        visible = self._group_by_item.get(parent, ())
+        tree.set_children(parent, *[item_by_warning[id(w)] for w in visible])
+    
+    def populate_tree_flat(self, filtered_data):
+        """Populate the tree with flat view (simple list)."""
+        if self.app.tree is None:
+            return
+            
+        # Bind the per-row lookups once; this loop runs for every warning
+        insert = self.app.tree.insert
+        get_tags = _STATUS_TAGS.get
+        item_by_warning = self._item_by_warning
+        
+        for warning in filtered_data:
+            message = warning["message"]
+            item_by_warning[id(warning)] = insert("", "end", text=f"Warning #{warning['index']}", values=(
+                warning["index"],
+                warning["status"],
+                message[:100] + ("..." if len(message) > 100 else ""),
+                ", ".join(warning["ids"])
+            ), tags=get_tags(warning["status"], ()))
+    
+    def show_warning_details(self, warning):
+        """Show warning detail window with status management."""
+        detail_window = tk.Toplevel(self.app.root)
+        detail_window.title(f"Warning #{warning['index']}")
+        detail_window.geometry("600x500")
+        detail_window.transient(self.app.root)
+        detail_window.grab_set()
+        
+        main_frame = ttk.Frame(detail_window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(main_frame, text=f"Warning #{warning['index']}", style="Title.TLabel").pack(anchor=tk.W, pady=(0, 10))
+        
+        # Message
+        ttk.Label(main_frame, text="Message:", style="Bold.TLabel").pack(anchor=tk.W)
+        message_text = tk.Text(main_frame, height=4, wrap=tk.WORD)
+        message_text.insert("1.0", warning["message"])
+        message_text.config(state=tk.DISABLED)
+        message_text.pack(fill=tk.X, pady=(0, 10))
+        
+        # Elements
+        ttk.Label(main_frame, text="Elements:", style="Bold.TLabel").pack(anchor=tk.W)
+        elements_text = tk.Text(main_frame, height=6, wrap=tk.WORD)
+        elements_text.insert("1.0", "\n".join(warning["elements"]) if isinstance(warning["elements"], list) else str(warning["elements"]))
+        elements_text.config(state=tk.DISABLED)
+        elements_text.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        
+        # IDs and controls
+        control_frame = ttk.Frame(main_frame)
+        control_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(control_frame, text="IDs:", style="Bold.TLabel").pack(side=tk.LEFT)
+        ids_label = ttk.Label(control_frame, text=", ".join(warning["ids"]))
+        ids_label.pack(side=tk.LEFT, padx=(10, 0))
+        
+        ttk.Button(control_frame, text="Copy IDs", 
+                  command=lambda: self.copy_ids(warning["ids"])).pack(side=tk.RIGHT)
+        
+        # Status management
+        status_frame = ttk.Frame(main_frame)
+        status_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(status_frame, text="Status:", style="Bold.TLabel").pack(side=tk.LEFT)
+        status_var = tk.StringVar(value=warning["status"])
+        status_combo = ttk.Combobox(status_frame, textvariable=status_var, 
+                                   values=["Open", "In Review", "Close"], state="readonly")
+        status_combo.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X)
+        
+        def save_changes():
+            warning["status"] = status_var.get()
+            warning["modified_date"] = datetime.now().isoformat()
+            # Fix up the edited row, then re-apply the filters and group summaries
+            self.refresh_warning_row(warning)
+            self.update_tree()
+            detail_window.destroy()
+            logger.info("Updated warning #%s status to: %s", warning['index'], warning['status'])
+        
+        ttk.Button(button_frame, text="Save", command=save_changes).pack(side=tk.RIGHT, padx=(10, 0))
+        ttk.Button(button_frame, text="Cancel", command=detail_window.destroy).pack(side=tk.RIGHT)
+    
+    def show_group_details(self, warnings_group):
+        """Show detail window for a group of warnings."""
+        detail_window = tk.Toplevel(self.app.root)
+        detail_window.title(f"Group Warning - {len(warnings_group)} items")
+        detail_window.geometry("800x600")
+        detail_window.transient(self.app.root)
+        detail_window.grab_set()
+        
+        main_frame = ttk.Frame(detail_window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(main_frame, text=f"Group: {len(warnings_group)} warning(s)", 
+                 style="Title.TLabel").pack(anchor=tk.W, pady=(0, 10))
+        
+        # Common message
+        ttk.Label(main_frame, text="Message:", style="Bold.TLabel").pack(anchor=tk.W)
+        message_text = tk.Text(main_frame, height=3, wrap=tk.WORD)
+        message_text.insert("1.0", warnings_group[0]["message"])
+        message_text.config(state=tk.DISABLED)
+        message_text.pack(fill=tk.X, pady=(0, 10))
+        
+        # Warnings list in the group
+        ttk.Label(main_frame, text="Warnings in the group:", style="Bold.TLabel").pack(anchor=tk.W)
+        
+        # Frame for the list
+        list_frame = ttk.Frame(main_frame)
+        list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        
+        # Treeview for the list
+        list_columns = ("Index", "Status", "IDs")
+        list_tree = ttk.Treeview(list_frame, columns=list_columns, show="headings", height=10)
+        
+        list_tree.heading("Index", text="N°")
+        list_tree.heading("Status", text="Status")
+        list_tree.heading("IDs", text="IDs")
+        
+        list_tree.column("Index", width=60)
+        list_tree.column("Status", width=100)
+        list_tree.column("IDs", width=300)
+        
+        list_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=list_tree.yview)
+        list_tree.configure(yscrollcommand=list_scrollbar.set)
+        
+        list_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        list_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Populate the list
+        for warning in warnings_group:
+            ids_str = ", ".join(warning["ids"])
+            tags = self.get_status_tags(warning["status"])
+            list_tree.insert("", "end", values=(warning["index"], warning["status"], ids_str), tags=tags)
+        
+        # Configure colors for the list
+        list_tree.tag_configure("open", background="#ffebee")
+        list_tree.tag_configure("in_review", background="#fff3e0")
+        list_tree.tag_configure("close", background="#e8f5e8")
+        
+        # Buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X)
+        
+        def copy_all_ids():
+            all_ids = self.get_all_ids_from_group(warnings_group)
+            if all_ids:
+                ids_string = ", ".join(all_ids)
+                detail_window.clipboard_clear()
+                detail_window.clipboard_append(ids_string)
+                self.app.warnings_info_label.config(text=f"All group IDs copied ({len(all_ids)})")
+                logger.info("Copied all %s IDs from group to clipboard", len(all_ids))
+        
+        ttk.Button(button_frame, text="Copy all IDs", command=copy_all_ids).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Close", command=detail_window.destroy).pack(side=tk.RIGHT)
+        
+    def copy_ids(self, ids):
+        """Copy IDs to clipboard."""
+        if ids:
+            ids_string = ", ".join(ids)
+            self.app.root.clipboard_clear()
+            self.app.root.clipboard_append(ids_string)
+            self.app.warnings_info_label.config(text=f"IDs copied: {ids_string}")
+
+    def show_journal_entry_details(self, event):
+        """Show detailed view of a journal entry on double-click."""
+        selection = self.app.journal_tree.selection()
+        if not selection:
+            return
+            
+        # Get the selected item
+        item = selection[0]
+        values = self.app.journal_tree.item(item, "values")
+        if not values or len(values) < 3:
+            return
+            
+        timestamp = values[0]
+        category = values[1]
+        content_truncated = values[2]
+        
+        # Get the full content of the entry shown in this row
+        entry = self._journal_entry_by_item.get(item)
+        if entry is not None:
+            content = entry.get('content') or content_truncated
+        else:
+            # Problem rows keep their full text in journal_full_descriptions
+            content = getattr(self.app, 'journal_full_descriptions', {}).get(item, content_truncated)
+        
+        # Refill the detail window (built on first use)
+        details = self._journal_entry_window()
+        detail_window = details['window']
+        detail_window.title(f"Journal Entry - {category}")
+        details['category'].configure(text=f"{category}")
+        if timestamp:
+            details['timestamp'].configure(text=f"{timestamp}")
+            details['timestamp_caption'].grid()
+            details['timestamp'].grid()
+        else:
+            details['timestamp_caption'].grid_remove()
+            details['timestamp'].grid_remove()
+        
+        content_text = details['text']
+        content_text.delete("1.0", tk.END)
+        content_text.insert("1.0", content)
+        details['content'] = content
+        
+        detail_window.deiconify()
+        detail_window.lift()
+        detail_window.grab_set()
+
+    def _journal_entry_window(self):
+        """
+        Return the widgets of the journal entry detail window, creating it on first use.
+        
+        Closing the window only hides it (and releases its grab), so later
+        double-clicks just refill it.
+        
+        Returns:
+            dict: 'window', the 'category'/'timestamp' value labels, the
+            'timestamp_caption' label, the content 'text' widget and the shown 'content'.
+        """
+        details = self._journal_entry_details
+        if details is not None and details['window'].winfo_exists():
+            return details
+        
+        # Create a detail window
+        detail_window = tk.Toplevel(self.app.root)
+        detail_window.geometry("800x500")
+        detail_window.transient(self.app.root)
+        
+        def close():
+            detail_window.grab_release()
+            detail_window.withdraw()
+        detail_window.protocol("WM_DELETE_WINDOW", close)
+        details = {'window': detail_window, 'content': ""}
+        
+        # Create the main frame
+        main_frame = ttk.Frame(detail_window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Display entry information
+        info_frame = ttk.Frame(main_frame)
+        info_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(info_frame, text=f"Category: ", style="Bold.TLabel").grid(row=0, column=0, sticky=tk.W)
+        details['category'] = ttk.Label(info_frame, style="Plain.TLabel")
+        details['category'].grid(row=0, column=1, sticky=tk.W)
+        
+        details['timestamp_caption'] = ttk.Label(info_frame, text=f"Timestamp: ", style="Bold.TLabel")
+        details['timestamp_caption'].grid(row=1, column=0, sticky=tk.W)
+        details['timestamp'] = ttk.Label(info_frame, style="Plain.TLabel")
+        details['timestamp'].grid(row=1, column=1, sticky=tk.W)
+        
+        # Content display
+        ttk.Label(main_frame, text="Content:", style="Bold.TLabel").pack(anchor=tk.W, pady=(10, 0))
+        
+        # Frame for content with scrollbars
+        content_frame = ttk.Frame(main_frame)
+        content_frame.pack(fill=tk.BOTH, expand=True, pady=(5, 10))
+        
+        # Add vertical scrollbar only
+        y_scrollbar = ttk.Scrollbar(content_frame)
+        y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Content text with word wrap and vertical scrollbar
+        content_text = tk.Text(content_frame, wrap=tk.WORD, height=15,
+                              yscrollcommand=y_scrollbar.set)
+        content_text.pack(fill=tk.BOTH, expand=True)
+        details['text'] = content_text
+        
+        # Configure scrollbar
+        y_scrollbar.config(command=content_text.yview)
+        
+        # Buttons frame
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        # Copy button; copies the entry currently shown
+        def copy_content():
+            detail_window.clipboard_clear()
+            detail_window.clipboard_append(details['content'])
+            if self.app.journal_info_label is not None:
+                self.app.journal_info_label.config(text="Journal entry content copied to clipboard")
+        
+        ttk.Button(button_frame, text="Copy Content", command=copy_content).pack(side=tk.LEFT)
+        
+        # Close button
+        ttk.Button(button_frame, text="Close", command=close).pack(side=tk.RIGHT)
+        
+        self._journal_entry_details = details
+        return details
+
+    def apply_journal_filter(self, *args):
+        """Apply selected filters to the journal entries."""
+        if self._journal_filter_after_id:
+            self.app.root.after_cancel(self._journal_filter_after_id)
+            self._journal_filter_after_id = None
+        
+        # Clear the treeview
+        self._clear_journal_tree()
+            
+        if not hasattr(self.app, 'journal_data') or not self.app.journal_data:
+            return
+
+        # Get filter values
+        category_filter = self.app.journal_filter.get() if self.app.journal_filter is not None else "All"
+        search_text = self.app.journal_search_var.get().lower() if self.app.journal_search_var is not None else ""
+        time_range = self.app.time_range_var.get() if self.app.time_range_var is not None else "All"
+        filter_by_model = self.app.filter_selected_model_var.get() if self.app.filter_selected_model_var is not None else False
+
+        # Get current model path if filtering by model
+        selected_model_path = None
+        if filter_by_model and self.app.model_selector is not None and hasattr(self.app, 'journal_models'):
+            selected_index = self.app.model_selector.current()
+            if selected_index >= 0 and selected_index < len(self.app.journal_models):
+                selected_model = self.app.journal_models[selected_index]
+                if "path" in selected_model:
+                    selected_model_path = selected_model["path"]
+
+        # Entry contents are compared lowercased, so lowercase the path once too
+        model_path_lc = selected_model_path.lower() if filter_by_model and selected_model_path else None
+
+        # Calculate time filter if needed
+        filter_timestamp = None
+        if time_range != "All":
+            # Timestamps are parsed once by the journal parser ('timestamp_dt')
+            latest_timestamp = max(
+                (entry["timestamp_dt"] for entry in self.app.journal_data.get('lines', []) if entry.get("timestamp_dt")),
+                default=None
+            )
+            
+            if latest_timestamp:
+                if time_range == "Last 15 min":
+                    filter_timestamp = latest_timestamp - timedelta(minutes=15)
+                elif time_range == "Last 1 hour":
+                    filter_timestamp = latest_timestamp - timedelta(hours=1)
+
+        # Filter entries
+        visible_entries = []
+        entries = self.app.journal_data.get('lines', [])
+        for entry, content in zip(entries, self._journal_contents_lowercased(entries)):
+            # Apply category filter
+            category = entry.get("category", "")
+            if category_filter != "All" and category != category_filter:
+                continue
+
+            # Apply text search filter
+            if search_text and search_text not in content:
+                continue
+
+            # Apply model filter: the entry belongs to the model or mentions its path
+            if (model_path_lc and entry.get("model") != selected_model_path
+                    and model_path_lc not in content):
+                continue
+
+            # Apply time filter (entries without a parsed timestamp are included)
+            if filter_timestamp:
+                entry_ts = entry.get("timestamp_dt")
+                if entry_ts and entry_ts < filter_timestamp:
+                    continue
+
+            visible_entries.append(entry)
+
+        # Display the entries that passed every filter
+        self.app.journal_visible_rows = visible_entries
+        self._fill_journal_tree(self._journal_rows(visible_entries), visible_entries)
+        displayed_count = len(visible_entries)
+
+        # Update info label
+        if self.app.journal_info_label is not None:
+            self.app.journal_info_label.config(text=f"Displaying {displayed_count} of {len(entries)} entries")
+        
+        logger.debug("Journal filter applied: displayed %s/%s entries", displayed_count, len(entries))
+
+    def clear_text_filter(self):
+        """Clear the text filter and refresh the journal view."""
+        if self.app.journal_search_var is not None:
+            self.app.journal_search_var.set("")
+        self.apply_journal_filter()
+        logger.debug("Journal text filter cleared")
+
+    def update_worker_log_view(self):
+        """Update the UI to display worker log entries."""
+        if self.app.journal_tree is None:
+            return
+
+        # Clear existing items
+        self._clear_journal_tree()
+
+        if hasattr(self.app, 'worker_log_entries'):
+            entries = self.app.worker_log_entries
+            self.app.journal_visible_rows = [
+                {
+                    'timestamp': entry.timestamp,
+                    'category': entry.level,
+                    'content': entry.message
+                }
+                for entry in entries
+            ]
+            self._fill_journal_tree([
+                (
+                    entry.timestamp,
+                    entry.level,
+                    entry.message[:100] + ('...' if len(entry.message) > 100 else '')
+                )
+                for entry in entries
+            ], self.app.journal_visible_rows)
+
+    def update_journal_tree(self):
+        """Populates the journal treeview with found problems and logs them to the console."""
+        if self.app.journal_tree is None:
+            logger.error("App object does not have a 'journal_tree' attribute.")
+            raise AttributeError("App object does not have a 'journal_tree' attribute.")
+
+        self._clear_journal_tree()
+
+        # Store the full descriptions for later use
+        self.app.journal_full_descriptions = {}
+        
+        for i, problem in enumerate(self.app.journal_problems):
+            logger.info("Problem found: Timestamp=%s, Type=%s, Source=%s, Description=%s", problem['timestamp'], problem['type'], problem['source'], problem['description'])
+            
+            # Create an ID for this item to reference the full description
+            item_id = f"journal_problem_{i}"
+            
+            # Store the full description
+            self.app.journal_full_descriptions[item_id] = problem["description"]
+            self.app.journal_visible_rows.append({
+                'timestamp': problem["timestamp"],
+                'category': problem["type"],
+                'command': problem["source"],
+                'content': problem["description"]
+            })
+            
+            # Insert with truncated description for display
+            trunc_desc = problem["description"][:100] + ("..." if len(problem["description"]) > 100 else "")
+            
+            # The journal tree has Timestamp / Category / Content columns
+            self.app.journal_tree.insert("", "end", iid=item_id, values=(
+                problem["timestamp"],
+                problem["type"],
+                trunc_desc
+            ))
+            
+    def on_journal_tree_double_click(self, event):
+        """Handle double click on journal tree item to show full details."""
+        item = self.app.journal_tree.focus()
+        if not item:
+            return
+            
+        if hasattr(self.app, 'journal_full_descriptions') and item in self.app.journal_full_descriptions:
+            # Get the problem details
+            values = self.app.journal_tree.item(item, "values")
+            timestamp = values[0]
+            problem_type = values[1]
+            source = values[2]
+            full_description = self.app.journal_full_descriptions[item]
+            
+            details = self._problem_details_window()
+            details['window'].title(f"Journal Problem Details - {problem_type}")
+            details['timestamp'].configure(text=f"Timestamp: {timestamp}")
+            details['type'].configure(text=f"Type: {problem_type}")
+            details['source'].configure(text=f"Source: {source}")
+            
+            text_widget = details['text']
+            text_widget.configure(state="normal")
+            text_widget.delete("1.0", tk.END)
+            text_widget.insert("1.0", full_description)
+            text_widget.configure(state="disabled")  # Make it read-only
+            
+            details['window'].deiconify()
+            details['window'].lift()
+
+    def _problem_details_window(self):
+        """
+        Return the widgets of the journal problem details window, creating it on first use.
+        
+        Closing the window only hides it, so later double-clicks just refill it.
+        
+        Returns:
+            dict: 'window', the 'timestamp'/'type'/'source' labels and the 'text' widget.
+        """
+        details = self._problem_details
+        if details is not None and details['window'].winfo_exists():
+            return details
+        
+        # Create a new window to show the details
+        details_window = tk.Toplevel(self.app.root)
+        details_window.geometry("800x400")
+        details_window.protocol("WM_DELETE_WINDOW", details_window.withdraw)
+        
+        # Create a frame with padding
+        frame = ttk.Frame(details_window, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Add labels for metadata
+        details = {'window': details_window}
+        for key in ('timestamp', 'type', 'source'):
+            details[key] = ttk.Label(frame, style="Bold.TLabel")
+            details[key].pack(anchor="w")
+        
+        # Add a separator
+        ttk.Separator(frame, orient="horizontal").pack(fill="x", pady=10)
+        
+        # Add a text widget with the full description
+        ttk.Label(frame, text="Full Description:", style="Bold.TLabel").pack(anchor="w")
+        
+        text_frame = ttk.Frame(frame)
+        text_frame.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+        
+        text_widget = tk.Text(text_frame, wrap="word", padx=5, pady=5)
+        text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=text_widget.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        text_widget.configure(yscrollcommand=scrollbar.set)
+        details['text'] = text_widget
+        
+        # Add a close button
+        ttk.Button(frame, text="Close", command=details_window.withdraw).pack(pady=(10, 0))
+        
+        self._problem_details = details
+        return details
@@ -0,0 +1,692 @@
+"""
+This module contains the parsing logic for HTML and Journal files.
+"""
+import re
+import os
+import codecs
+import urllib.parse
+from functools import lru_cache
+from datetime import datetime, timedelta
+from tkinter import messagebox
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
+    BS4_AVAILABLE = True
+    logger.info("BeautifulSoup4 imported successfully")
+except ImportError:
+    BS4_AVAILABLE = False
+    BeautifulSoup = None  # Definizione esplicita per evitare errori di binding
+    SoupStrainer = None
+    logger.warning("BeautifulSoup4 is not available. HTML parsing will be limited.")
+
+try:
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+    logger.debug("lxml imported successfully, using it for HTML parsing")
+except ImportError:
+    LXML_AVAILABLE = False
+    lxml_html = None
+
+# Only the warnings table is built into the soup; the report's head and styles are skipped
+_TABLE_ONLY = SoupStrainer('table') if BS4_AVAILABLE else None
+
+# Element ids in the warnings report, e.g. "Walls : Basic Wall : id 123456"
+_RE_ID = re.compile(r'id (\d+)')
+
+# Format of the timestamps found in journal lines, e.g. "27-Sep-2025 13:08:35.485"
+_JOURNAL_TIMESTAMP_FORMAT = "%d-%b-%Y %H:%M:%S.%f"
+
+# Patterns applied to every journal line, compiled once at import
+_RE_TIMESTAMP = re.compile(r"\d+-\w+-\d+ \d+:\d+:\d+\.\d+")
+_RE_CMD = re.compile(r'Jrn\.Command\s+"([^"]+)"\s*,\s*"([^"]+)"')
+_RE_GAP = re.compile(r'(\d+\.\d+)!!!')
+_RE_PATH = re.compile(r'Path = "([^"]+\.rvt)"')
+_RE_REGION = re.compile(r'Region = "([^"]+)"')
+_RE_SERVER = re.compile(r'Central server = "([^"]*)"')
+_RE_IS_SERVER = re.compile(r'Is server path = (\w+)')
+_RE_USER = re.compile(r"User's Name ([^,]+),")
+_RE_USERNAME = re.compile(r'Username\s*,\s*"([^"]+)"')
+_RE_HANDLE = re.compile(r'\(this=(0x[0-9A-Fa-f]+)\)')
+
+# Journals are read line by line; a large buffer keeps the number of reads low
+_READ_BUFFER_SIZE = 1 << 20
+
+
+def _sniff_encoding(file_path):
+    """
+    Pick the encoding of a journal from its byte-order mark.
+    
+    Journals without a BOM are read as UTF-8; callers open them with
+    errors='replace', so stray legacy bytes never abort the parse.
+    """
+    with open(file_path, 'rb') as file:
+        head = file.read(4)
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    return 'utf-8'
+
+# The same model path is usually opened (and logged) many times per journal
+_unquote = lru_cache(maxsize=256)(urllib.parse.unquote)
+
+# Every category the journal parsers assign, in the order the journal tab lists them
+JOURNAL_CATEGORIES = (
+    "Control", "Header", "Event", "Command", "Journal", "Comment", "Unknown",
+    "Error", "BIG GAP", "Performance", "Model"
+)
+
+# Two-character comment prefixes of journal lines and their categories
+_PREFIX_CATEGORIES = {"'C": "Control", "'H": "Header", "'E": "Event"}
+
+# Content markers that override the prefix category, one group per category.
+# "exception" is matched case-insensitively, as line.lower() used to.
+_RE_CATEGORY_MARKER = re.compile(
+    r"(BIG_GAP)"
+    r"|(Unrecoverable error|(?i:exception)|API_ERROR|Error posted)"
+    r"|(RAM Statistics|VM Statistics|Delta VM|Delta RAM)"
+)
+# Indexed by group number; a lower group wins when a line has several markers
+_MARKER_CATEGORIES = (None, "BIG GAP", "Error", "Performance")
+
+
+def _marker_category(line):
+    """Return the content-marker category of a journal line, or None."""
+    marker = _RE_CATEGORY_MARKER.search(line)
+    if marker is None:
+        return None
+    rank = marker.lastindex
+    if rank > 1:
+        # The leftmost marker is not necessarily the strongest one
+        rank = min(m.lastindex for m in _RE_CATEGORY_MARKER.finditer(line, marker.start()))
+    return _MARKER_CATEGORIES[rank]
+
+class ErrorHandler:
+    """Handles error and warning messages for the application."""
+    
+    @staticmethod
+    def show_error(title, message):
+        """Display an error message box with the given title and message."""
+        logger.error("%s: %s", title, message)
+        messagebox.showerror(title, message)
+
+    @staticmethod
+    def show_warning(title, message):
+        """Display a warning message box with the given title and message."""
+        logger.warning("%s: %s", title, message)
+        messagebox.showwarning(title, message)
+
+class HTMLParser:
+    """Parser for HTML warning files exported from Revit."""
+    
+    @staticmethod
+    def parse(html_content):
+        """
+        Parses the HTML content and extracts error messages and elements as lists.
+        Returns a list of warning dicts with error message, elements, ids, and metadata.
+        
+        Args:
+            html_content (str | bytes | mmap.mmap): The HTML content to parse.
+                Bytes-like content is decoded as UTF-8.
+            
+        Returns:
+            list: A list of dictionaries, each representing a warning with its associated metadata.
+            
+        Raises:
+            RuntimeError: If neither lxml nor BeautifulSoup4 is installed.
+            ValueError: If the HTML content has no <table>.
+            
+        Errors are raised rather than shown, since parse runs on a background thread;
+        the caller reports them from the Tk thread.
+        """
+        if not LXML_AVAILABLE and not BS4_AVAILABLE:
+            raise RuntimeError("BeautifulSoup4 is not available.\n\nInstall it using:\npip install beautifulsoup4")
+
+        logger.debug("Starting HTML parsing")
+        # lxml (libxml2) is much faster; BeautifulSoup remains the fallback
+        if LXML_AVAILABLE:
+            rows = HTMLParser._table_rows_lxml(html_content)
+        else:
+            rows = HTMLParser._table_rows_bs4(html_content)
+        
+        if rows is None:
+            raise ValueError("Could not find a <table> in the HTML content.")
+
+        warnings = []
+        logger.debug("Found %s warning rows in the HTML table", len(rows) - 1)
+        # All warnings of one import share the same creation time
+        now_iso = datetime.now().isoformat()
+        
+        for i, (error_message, elements) in enumerate(rows[1:], 1):  # Skip header row
+            if error_message is None:
+                continue
+            # Extract all ids from all elements in one scan; the newline keeps a
+            # match from spanning two elements
+            ids = _RE_ID.findall("\n".join(elements))
+            
+            warning = {
+                "index": i,
+                "message": error_message,
+                "elements": elements,
+                "ids": ids,
+                "status": "Open",
+                "created_date": now_iso,
+                "modified_date": now_iso
+            }
+            warnings.append(warning)
+        
+        logger.info("Successfully parsed %s warnings from HTML", len(warnings))
+        return warnings
+
+    @staticmethod
+    def _table_rows_lxml(html_content):
+        """
+        Read the rows of the first <table> with lxml.
+        
+        Returns:
+            list | None: One (message, elements) pair per <tr>, (None, None) for rows
+            without exactly two cells, or None if the document has no table.
+        """
+        if not len(html_content):
+            # lxml rejects an empty document outright; report it like any table-less one
+            return None
+        if isinstance(html_content, str):
+            root = lxml_html.document_fromstring(html_content)
+        else:
+            # Feed bytes-like content (typically an mmap) in slices rather than
+            # copying the whole report into one bytes object first
+            parser = lxml_html.HTMLParser(encoding='utf-8')
+            for start in range(0, len(html_content), _READ_BUFFER_SIZE):
+                parser.feed(html_content[start:start + _READ_BUFFER_SIZE])
+            root = parser.close()
+        
+        table = root.find('.//table')
+        if table is None:
+            return None
+        
+        rows = []
+        for row in table.iter('tr'):
+            cells = list(row.iter('td'))
+            if len(cells) != 2:
+                rows.append((None, None))
+                continue
+            # Same text as BeautifulSoup's get_text(strip=True) / stripped_strings,
+            # read straight from the parsed cells
+            message = "".join(text.strip() for text in cells[0].itertext())
+            elements = [text.strip() for text in cells[1].itertext() if text.strip()]
+            rows.append((message, elements))
+        return rows
+
+    @staticmethod
+    def _table_rows_bs4(html_content):
+        """Read the rows of the first <table> with BeautifulSoup (see _table_rows_lxml)."""
+        # Usando import locale per evitare errori Pylance quando BS4_AVAILABLE=False
+        from bs4 import BeautifulSoup as BS
+        
+        if isinstance(html_content, str):
+            soup = BS(html_content, 'html.parser', parse_only=_TABLE_ONLY)
+        else:
+            soup = BS(html_content, 'html.parser', from_encoding='utf-8', parse_only=_TABLE_ONLY)
+        table = soup.find('table')
+        
+        if table is None:
+            return None
+
+        rows = []
+        # Find_all è un metodo garantito per BeautifulSoup
+        for row in table.find_all('tr'):
+            cells = row.find_all('td')
+            if len(cells) != 2:
+                rows.append((None, None))
+                continue
+            error_message = cells[0].get_text(strip=True)
+            # Elements are separated by <br> tags, i.e. one text node each
+            elements = [el.strip() for el in cells[1].stripped_strings]
+            rows.append((error_message, elements))
+        return rows
+
+class JournalEntry:
+    """
+    A categorized journal line produced by JournalParser.parse_journal.
+    
+    Uses __slots__ instead of a per-line dict, since a journal can have millions of lines.
+    model_info is only set on "Model" lines and is None otherwise.
+    """
+    __slots__ = ("category", "content", "timestamp", "command", "model_info")
+
+    def __init__(self, category, content, timestamp, command="", model_info=None):
+        self.category = category
+        self.content = content
+        self.timestamp = timestamp
+        self.command = command
+        self.model_info = model_info
+
+class JournalParser:
+    """Parser for Revit journal files."""
+    
+    @staticmethod
+    def parse_journal(file_path):
+        """
+        Parses a Revit journal file and categorizes lines based on their prefixes and important content.
+        Returns a list of JournalEntry objects with categorized data.
+        
+        Args:
+            file_path (str): Path to the journal file to parse.
+        
+        Returns:
+            list: A list of JournalEntry objects, one per journal line.
+        """
+        parsed_data = []
+        last_timestamp = ""  # Memorizzare l'ultimo timestamp trovato
+        models_info = []  # Lista di modelli trovati
+        current_model_info = {}  # Informazioni sul modello corrente
+        current_command = ""  # Comando corrente
+        
+        try:
+            encoding = _sniff_encoding(file_path)
+            logger.debug("Parsing journal with %s encoding", encoding)
+            with open(file_path, 'r', encoding=encoding, errors='replace', buffering=_READ_BUFFER_SIZE) as file:
+                for line in file:
+                    line = line.strip()
+                    
+                    # Extract timestamp for all lines if present
+                    timestamp = ""
+                    # Extract timestamp like "27-Sep-2025 13:08:35.485"
+                    match = _RE_TIMESTAMP.search(line)
+                    if match:
+                        timestamp = match.group(0)
+                        last_timestamp = timestamp
+                    else:
+                        # If no timestamp in this line, use the most recent timestamp
+                        timestamp = last_timestamp
+                    
+                    # Determine primary category based on prefix
+                    category = _PREFIX_CATEGORIES.get(line[:2])
+                    if category is None:
+                        if line.startswith("Jrn.Command"):
+                            category = "Command"
+                            # Extract command details
+                            command_match = _RE_CMD.search(line)
+                            if command_match:
+                                current_command = f"{command_match.group(1)}: {command_match.group(2)}"
+                        elif line.startswith("Jrn."):
+                            category = "Journal"
+                        elif line.startswith("'"):
+                            category = "Comment"
+                        else:
+                            category = "Unknown"
+                    
+                    # Identify special categories based on content (big gaps,
+                    # errors/exceptions, memory statistics)
+                    marker_category = _marker_category(line)
+                    if marker_category:
+                        category = marker_category
+                        if category == "BIG GAP":
+                            # Extract gap time if available
+                            gap_match = _RE_GAP.search(line)
+                            if gap_match:
+                                gap_time = gap_match.group(1)
+                                line = f"BIG GAP: {gap_time} seconds - {line}"
+                    
+                    # Extract model information - check for "ModelPath Created" lines
+                    if "ModelPath Created" in line and "Path = " in line and ".rvt" in line:
+                        # Create a new model info entry
+                        current_model_info = {"timestamp": timestamp}
+                        
+                        # Extract path
+                        path_match = _RE_PATH.search(line)
+                        if path_match:
+                            model_path = path_match.group(1)
+                            # URL decode the path to handle escaped characters
+                            model_path = _unquote(model_path)
+                            current_model_info["path"] = model_path
+                        
+                        # Extract region
+                        region_match = _RE_REGION.search(line)
+                        if region_match:
+                            current_model_info["region"] = region_match.group(1)
+                            
+                        # Extract server info
+                        server_match = _RE_SERVER.search(line)
+                        if server_match:
+                            current_model_info["server"] = server_match.group(1)
+                            
+            # Extract Is server path
+                        server_path_match = _RE_IS_SERVER.search(line)
+                        if server_path_match:
+                            is_server = server_path_match.group(1)
+                            current_model_info["is_server_path"] = str(is_server.lower() == "true")
+                        
+                        # Add to models list if we have a valid path
+                        if "path" in current_model_info:
+                            # Make a copy to avoid reference issues
+                            models_info.append(current_model_info.copy())
+                            
+                            # Also mark this line as special category
+                            category = "Model"
+                    # Extract user information if not already found
+                    if "User's Name " in line:
+                        user_match = _RE_USER.search(line)
+                        if user_match:
+                            username = user_match.group(1)
+                            # Add username to all model infos
+                            for model in models_info:
+                                if "username" not in model:
+                                    model["username"] = username
+                    
+                    # Create entry with all gathered information
+                    entry = JournalEntry(
+                        category,
+                        line,
+                        timestamp,
+                        current_command if category == "Command" else ""
+                    )
+                    
+                    # Add model information if this is a model line
+                    if category == "Model" and current_model_info:
+                        # Convertire valori non stringa in stringa per evitare errori di tipo
+                        model_info_copy = {}
+                        for k, v in current_model_info.items():
+                            model_info_copy[k] = str(v) if not isinstance(v, str) else v
+                        entry.model_info = model_info_copy
+                    
+                    parsed_data.append(entry)
+                    
+                    # Reset command for next entries
+                    if category == "Command":
+                        current_command = ""
+            
+            logger.info("Successfully parsed journal with %s encoding", encoding)
+            return parsed_data
+        
+        except Exception as e:
+            ErrorHandler.show_error("Journal Parsing Error", f"Failed to parse journal file:\n{str(e)}")
+            logger.error("Journal parsing failed with error: %s", e)
+            return []  # Restituisci una lista vuota in caso di errore
+
+    @staticmethod
+    def parse_journal_with_models(file_path):
+        """
+        Parses a Revit journal file, extracts models, and associates lines with models.
+        Returns a dictionary with models and categorized lines.
+        
+        Args:
+            file_path (str): Path to the journal file to parse.
+        
+        Returns:
+            dict: A dictionary containing header info, models, and categorized lines.
+        """
+        try:
+            encoding = _sniff_encoding(file_path)
+            logger.debug("Parsing journal with models using %s encoding", encoding)
+            models = []
+            model_handles = {}
+            categorized_lines = []
+            header_info = {}
+            current_model = "All models"
+
+            with open(file_path, 'r', encoding=encoding, errors='replace', buffering=_READ_BUFFER_SIZE) as file:
+                for line in file:
+                    line = line.strip()
+
+                    # Extract header information
+                    if "Build:" in line:
+                        header_info['build'] = line.partition('Build:')[2].strip()
+                    elif "Branch:" in line:
+                        header_info['branch'] = line.partition('Branch:')[2].strip()
+                    elif "Release:" in line:
+                        header_info['release'] = line.partition('Release:')[2].strip()
+                    elif "Username" in line:
+                        user_match = _RE_USERNAME.search(line)
+                        if user_match:
+                            header_info['username'] = user_match.group(1)
+                        else:
+                            header_info['username'] = "Unknown"
+
+                    # Extract model information
+                    if "ModelPath Created" in line:
+                        model_match = _RE_PATH.search(line)
+                        if model_match:
+                            model_path = _unquote(model_match.group(1))
+                            models.append(model_path)
+                            current_model = model_path
+
+                    # Associate lines with models
+                    handle_match = _RE_HANDLE.search(line)
+                    if handle_match:
+                        model_handles[handle_match.group(1)] = current_model
+
+                    # Categorize lines with detailed logic (same as parse_journal)
+                    timestamp_match = _RE_TIMESTAMP.search(line)
+                    
+                    # Determine primary category based on prefix
+                    category = _PREFIX_CATEGORIES.get(line[:2])
+                    if category is None:
+                        if line.startswith("Jrn.Command"):
+                            category = "Command"
+                        elif line.startswith("Jrn."):
+                            category = "Journal"
+                        elif line.startswith("'"):
+                            category = "Comment"
+                        else:
+                            category = "Unknown"
+                    
+                    # Identify special categories based on content
+                    marker_category = _marker_category(line)
+                    if marker_category:
+                        category = marker_category
+                    elif "ModelPath Created" in line:
+                        category = "Model"
+                    
+                    timestamp = timestamp_match.group(0) if timestamp_match else None
+                    # Parse once here so the time-range filter only compares datetimes
+                    timestamp_dt = None
+                    if timestamp:
+                        try:
+                            timestamp_dt = datetime.strptime(timestamp, _JOURNAL_TIMESTAMP_FORMAT)
+                        except ValueError:
+                            pass
+                    
+                    categorized_lines.append({
+                        'timestamp': timestamp,
+                        'timestamp_dt': timestamp_dt,
+                        'category': category,
+                        'content': line,
+                        # Truncated once here for the journal table, which redraws on every filter
+                        'content_short': line if len(line) <= 100 else line[:100] + '...',
+                        'model': current_model
+                    })
+
+            logger.info("Successfully parsed journal with models, found %s models", len(models))
+            # Assicuriamoci che 'header' sia sempre un dizionario di stringhe
+            string_header = {}
+            for key, value in header_info.items():
+                string_header[key] = str(value)
+            
+            return {
+                'header': string_header,
+                'models': ['All models'] + models,
+                'lines': categorized_lines
+            }
+
+        except Exception as e:
+            logger.error("Failed parsing journal with models: %s", e)
+            raise RuntimeError("Failed to parse journal file") from e
+
+class WorkerLogEntry:
+    """A "<timestamp> <level> <message>" line produced by WorkerLogParser.parse_worker_log."""
+    __slots__ = ("timestamp", "level", "message")
+
+    def __init__(self, timestamp, level, message):
+        self.timestamp = timestamp
+        self.level = level
+        self.message = message
+
+class WorkerLogParser:
+    """Parser for worker log files generated by Revit."""
+
+    @staticmethod
+    def parse_worker_log(file_path):
+        """
+        Parse the worker log file and return structured data.
+        
+        Args:
+            file_path (str): Path to the worker log file to parse.
+            
+        Returns:
+            dict: {'entries': [WorkerLogEntry, ...]} or None if parsing failed.
+        """
+        try:
+            logger.debug("Starting parsing worker log: %s", file_path)
+            if not os.path.exists(file_path):
+                logger.warning("Worker log file does not exist: %s", file_path)
+                return None
+                
+            entries = []
+            with open(file_path, 'r') as file:
+                for line in file:
+                    line = line.strip()
+                    # Split on the first two spaces without building a list per line
+                    level_start = line.find(' ') + 1
+                    message_start = line.find(' ', level_start) + 1 if level_start else 0
+                    if message_start:
+                        entries.append(WorkerLogEntry(
+                            line[:level_start - 1],
+                            line[level_start:message_start - 1],
+                            line[message_start:]
+                        ))
+
+            logger.info("Successfully parsed %s entries from worker log", len(entries))
+            return {'entries': entries}
+        except Exception as e:
+            logger.error("Error parsing worker log: %s", e, exc_info=True)
+            return None
+
+class JournalProblemFinder:
+    """
+    Analyzes a Revit journal file to find potential problems.
+    """
+    def __init__(self, time_threshold_sec=10, ram_spike_mb=500):
+        self.time_threshold_sec = time_threshold_sec
+        self.ram_spike_mb = ram_spike_mb
+        self.patterns = {
+            "ERROR": re.compile(r"error|exception|fail|cannot", re.IGNORECASE),
+            "API_WARNING": re.compile(r"API_WARNING"),
+            "PERFORMANCE": re.compile(r"slightly off axis", re.IGNORECASE),
+            "RESOURCE_SPIKE": re.compile(r"RAM:.*?Used \+(\d+) MB"),
+            "TIMESTAMP": re.compile(r"^'C (\d{2}-\w{3}-\d{4} \d{2}:\d{2}:\d{2}\.\d{3});\s*(.*)")
+        }
+        # The problem patterns are ASCII, so raw journal bytes can be matched
+        # without decoding every line first
+        self.byte_patterns = {
+            name: re.compile(pattern.pattern.encode('ascii'), pattern.flags & ~re.UNICODE)
+            for name, pattern in self.patterns.items()
+        }
+        # One pass over each line tells which of the problem patterns can match.
+        # The keywords cannot overlap, so finditer sees every kind present; the
+        # resource group only finds the "RAM:" prefix, the full RESOURCE_SPIKE
+        # pattern is run afterwards to read the amount.
+        self._problem_scan_re = re.compile(
+            rb"(?P<error>(?i:error|exception|fail|cannot))"
+            rb"|(?P<api_warning>API_WARNING)"
+            rb"|(?P<performance>(?i:slightly off axis))"
+            rb"|(?P<resource>RAM:)"
+        )
+        logger.debug("JournalProblemFinder initialized")
+
+    def find_problems(self, file_content):
+        """
+        Analyzes journal content to find problems.
+        
+        Args:
+            file_content (str): Content of the journal file to analyze.
+            
+        Returns:
+            list: A list of problems found in the journal.
+        """
+        return self.find_problems_stream(line.encode('utf-8') for line in file_content.splitlines())
+
+    def find_problems_stream(self, line_iter):
+        """
+        Analyzes journal lines one at a time to find problems.
+        
+        Only the current line is held in memory, so a journal opened in binary
+        mode can be passed directly regardless of its size.
+        
+        Args:
+            line_iter (iterable): Journal lines as UTF-8 bytes, e.g. a file opened with 'rb'.
+            
+        Returns:
+            list: A list of problems found in the journal. Descriptions hold the full
+            line; the journal table truncates them for display.
+        """
+        problems = []
+        last_timestamp = None
+        timestamp_re = self.byte_patterns["TIMESTAMP"]
+        resource_spike_re = self.byte_patterns["RESOURCE_SPIKE"]
+        problem_scan = self._problem_scan_re.finditer
+        
+        logger.debug("Starting problem analysis in journal")
+        line_count = 0
+        for raw_line in line_iter:
+            line_count += 1
+            raw_line = raw_line.rstrip(b'\r\n')
+            # Only lines that produce a problem are decoded
+            line = None
+            
+            # Check for timestamp to keep track of when issues occur
+            timestamp_match = timestamp_re.match(raw_line)
+            if timestamp_match:
+                last_timestamp = timestamp_match.group(1).decode('ascii')
+            
+            kinds = {match.lastgroup for match in problem_scan(raw_line)}
+            if not kinds:
+                continue
+                
+            # Check for errors and warnings
+            if "error" in kinds:
+                line = raw_line.decode('utf-8', errors='replace')
+                problems.append({
+                    "timestamp": last_timestamp or "Unknown",
+                    "type": "Error",
+                    "source": "Journal",
+                    "description": line
+                })
+                
+            # Check for API warnings
+            if "api_warning" in kinds:
+                line = line or raw_line.decode('utf-8', errors='replace')
+                problems.append({
+                    "timestamp": last_timestamp or "Unknown",
+                    "type": "API Warning",
+                    "source": "Revit API",
+                    "description": line
+                })
+                
+            # Check for performance issues
+            if "performance" in kinds:
+                line = line or raw_line.decode('utf-8', errors='replace')
+                problems.append({
+                    "timestamp": last_timestamp or "Unknown",
+                    "type": "Performance",
+                    "source": "Geometry",
+                    "description": "Possible performance issue: " + line
+                })
+                
+            # Check for resource spikes
+            resource_match = resource_spike_re.search(raw_line) if "resource" in kinds else None
+            if resource_match:
+                ram_spike = int(resource_match.group(1))
+                if ram_spike > self.ram_spike_mb:
+                    problems.append({
+                        "timestamp": last_timestamp or "Unknown",
+                        "type": "Resource Spike",
+                        "source": "Memory Usage",
+                        "description": f"RAM spike of {ram_spike} MB detected"
+                    })
+                    
+        logger.info("Journal analysis complete. Found %s problems in %s lines", len(problems), line_count)
+        return problems
@@ -0,0 +1,663 @@
+"""
+This module handles the user interface setup for the Revit Warnings Manager.
+"""
+import os
+import time
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+import logging
+from .parsers import JOURNAL_CATEGORIES
+
+logger = logging.getLogger(__name__)
+
+# Modification time shown next to each journal in the sidebar
+_JOURNAL_DATE_FORMAT = "%Y-%m-%d %H:%M"
+
+# Journals tree rows inserted per event-loop slice while the sidebar is filled
+_JOURNALS_TREE_CHUNK = 50
+
+class UIManager:
+    """Manages the creation and layout of all UI components."""
+    def __init__(self, app_controller):
+        self.app = app_controller
+        self.root = self.app.root
+        # Details text of each cleaning tree row, keyed by (version, area index or None);
+        # reset whenever a new scan result is shown
+        self._cleaning_detail_cache = {}
+        # Bumped by every cleaning scan so results of an older scan are ignored;
+        # _cleaning_shown_scan_id is the scan whose partial result is in the tree
+        self._cleaning_scan_id = 0
+        self._cleaning_shown_scan_id = None
+        # Cleaning tree item ids of the shown scan: version -> node, id(area) -> (item, version, index)
+        self._cleaning_version_nodes = {}
+        self._cleaning_area_items = {}
+        # Cleaning tree item id -> (version, area index or None), read back on selection
+        self._cleaning_item_keys = {}
+        # Version -> (total size, total item count) of its areas, summed once per scan result
+        self._cleaning_version_totals = {}
+        # Bumped by every journals tree refresh so an older, still running fill stops
+        self._journals_refresh_id = 0
+
+    def setup_ui(self):
+        """Sets up the main UI, including notebook and tabs."""
+        self.setup_styles()
+
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.pack(fill=tk.BOTH, expand=True)
+
+        self.setup_warnings_tab()
+
+        # The journal and cleaning tabs, and the disk scans they start, are built the
+        # first time each tab is selected (or ensure_tab is called); keyed by tab text
+        self._pending_tabs = {}
+        for text, setup in (("Journal", self.setup_journal_tab), ("Cleaning", self.setup_cleaning_tab)):
+            tab_frame = ttk.Frame(self.notebook)
+            self.notebook.add(tab_frame, text=text)
+            self._pending_tabs[text] = (setup, tab_frame)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _on_tab_changed(self, event):
+        """Build a deferred tab into its frame the first time it is selected."""
+        self.ensure_tab(self.notebook.tab(self.notebook.select(), "text"))
+
+    def ensure_tab(self, text):
+        """
+        Build the deferred tab with the given text if it has not been built yet.
+        
+        Code that updates a tab's widgets from elsewhere (e.g. the journal loaders)
+        calls this first, since the widgets do not exist until the tab is built.
+        """
+        pending = self._pending_tabs.pop(text, None)
+        if pending:
+            setup, tab_frame = pending
+            setup(tab_frame)
+
+    def setup_styles(self):
+        """
+        Register the label styles used by the tabs and the detail windows.
+        
+        Labels refer to these shared fonts by style name instead of each passing its own font tuple.
+        """
+        # Keep references: a named font is deleted from Tk when its Font object is collected
+        self._fonts = {
+            'bold': tkfont.Font(root=self.root, family="Arial", size=10, weight="bold"),
+            'title': tkfont.Font(root=self.root, family="Arial", size=12, weight="bold"),
+            'plain': tkfont.Font(root=self.root, family="Arial", size=10),
+        }
+        self._style = ttk.Style(self.root)
+        self._style.configure("Bold.TLabel", font=self._fonts['bold'])
+        self._style.configure("Title.TLabel", font=self._fonts['title'])
+        self._style.configure("Plain.TLabel", font=self._fonts['plain'])
+
+    def setup_warnings_tab(self):
+        """Sets up the 'Warnings' tab with all its widgets."""
+        warnings_frame = ttk.Frame(self.notebook)
+        self.notebook.add(warnings_frame, text="Warnings")
+        warnings_frame.columnconfigure(1, weight=1)
+        warnings_frame.rowconfigure(2, weight=1)
+
+        # Control buttons
+        control_frame = ttk.Frame(warnings_frame)
+        control_frame.grid(row=0, column=0, columnspan=2, sticky="we", pady=(0, 10))
+        ttk.Button(control_frame, text="Load HTML", command=self.app.files.load_html).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(control_frame, text="Load JSON", command=self.app.files.load_json).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(control_frame, text="Save JSON", command=self.app.files.save_json).pack(side=tk.LEFT, padx=(0, 10))
+
+        # Filter frame
+        filter_frame = ttk.LabelFrame(warnings_frame, text="Filters", padding="5")
+        filter_frame.grid(row=1, column=0, columnspan=2, sticky="we", pady=(0, 10))
+
+        ttk.Label(filter_frame, text="Status:").pack(side=tk.LEFT, padx=(0, 5))
+        self.app.status_filter = ttk.Combobox(filter_frame, values=["All", "Open", "In Review", "Close"], 
+                                             state="readonly", width=10)
+        self.app.status_filter.set("All")
+        self.app.status_filter.pack(side=tk.LEFT, padx=(0, 10))
+        self.app.status_filter.bind('<<ComboboxSelected>>', self.app.events.apply_filter)
+
+        ttk.Label(filter_frame, text="Search:").pack(side=tk.LEFT, padx=(0, 5))
+        self.app.search_var = tk.StringVar()
+        self.app.search_entry = ttk.Entry(filter_frame, textvariable=self.app.search_var, width=30)
+        self.app.search_entry.pack(side=tk.LEFT, padx=(0, 10))
+        self.app.search_var.trace_add('write', self.app.events.schedule_filter)
+
+        # Checkbox for grouped view
+        self.app.group_mode = tk.BooleanVar(value=True)
+        self.app.group_checkbox = ttk.Checkbutton(filter_frame, text="Grouped View", 
+                                                variable=self.app.group_mode, command=self.app.events.toggle_group_mode)
+        self.app.group_checkbox.pack(side=tk.LEFT, padx=(20, 10))
+
+        # Expand/Collapse buttons
+        ttk.Button(filter_frame, text="Expand All", command=self.app.events.expand_all).pack(side=tk.RIGHT, padx=(5, 0))
+        ttk.Button(filter_frame, text="Collapse All", command=self.app.events.collapse_all).pack(side=tk.RIGHT, padx=(5, 0))
+
+        # Treeview for warnings
+        tree_frame = ttk.Frame(warnings_frame)
+        tree_frame.grid(row=2, column=0, columnspan=2, sticky="wens")
+        tree_frame.columnconfigure(0, weight=1)
+        tree_frame.rowconfigure(0, weight=1)
+
+        # Columns for the treeview
+        columns = ("Count", "Status", "Message", "IDs")
+        self.app.tree = ttk.Treeview(tree_frame, columns=columns, show="tree headings", height=25)
+
+        # Column configuration
+        self.app.tree.heading("#0", text="Warning")
+        self.app.tree.heading("Count", text="Count")
+        self.app.tree.heading("Status", text="Status")
+        self.app.tree.heading("Message", text="Message")
+        self.app.tree.heading("IDs", text="IDs")
+
+        self.app.tree.column("#0", width=200)
+        self.app.tree.column("Count", width=50)
+        self.app.tree.column("Status", width=80)
+        self.app.tree.column("Message", width=500)
+        self.app.tree.column("IDs", width=200)
+
+        # Status colors (tags assigned by EventHandlers.get_status_tags)
+        self.app.tree.tag_configure("open", background="#ffebee")
+        self.app.tree.tag_configure("in_review", background="#fff3e0")
+        self.app.tree.tag_configure("close", background="#e8f5e8")
+
+        # Scrollbar
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.app.tree.yview)
+        self.app.tree.configure(yscrollcommand=scrollbar.set)
+
+        self.app.tree.grid(row=0, column=0, sticky="wens")
+        scrollbar.grid(row=0, column=1, sticky="ns")
+
+        # Bind events
+        self.app.tree.bind("<Button-3>", self.app.events.on_tree_right_click)  # Right click to copy IDs
+        self.app.tree.bind("<Double-1>", self.app.events.on_tree_double_click)  # Double click for details
+        self.app.tree.bind("<<TreeviewOpen>>", self.app.events.on_tree_open)  # Insert group rows on first expand
+
+        # Info label for Warnings
+        self.app.warnings_info_label = ttk.Label(warnings_frame, text="Load an HTML or JSON file to start")
+        self.app.warnings_info_label.grid(row=3, column=0, columnspan=2, pady=(10, 0))
+
+    def setup_journal_tab(self, journal_tab):
+        """Setup the Journal tab with sidebar for journal selection and main content area."""
+
+        # Main container with sidebar and content area
+        main_container = ttk.PanedWindow(journal_tab, orient=tk.HORIZONTAL)
+        main_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # LEFT SIDEBAR - Journal browser
+        sidebar_frame = ttk.Frame(main_container, width=300)
+        main_container.add(sidebar_frame, weight=0)
+
+        # Sidebar title
+        ttk.Label(sidebar_frame, text="Revit Journals", style="Bold.TLabel").pack(padx=5, pady=5)
+
+        # Journal tree
+        journal_sidebar_frame = ttk.Frame(sidebar_frame)
+        journal_sidebar_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=(0, 5))
+
+        self.app.journals_tree = ttk.Treeview(journal_sidebar_frame, show="tree")
+        journals_scrollbar = ttk.Scrollbar(journal_sidebar_frame, orient=tk.VERTICAL, command=self.app.journals_tree.yview)
+        self.app.journals_tree.configure(yscrollcommand=journals_scrollbar.set)
+
+        self.app.journals_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        journals_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Load selected journal button
+        ttk.Button(sidebar_frame, text="► Load Selected", command=self.load_selected_journal, width=15).pack(padx=5, pady=5)
+
+        # Refresh journals button
+        ttk.Button(sidebar_frame, text="🔄 Refresh", command=self.refresh_journals_tree, width=15).pack(padx=5, pady=(0, 5))
+
+        # RIGHT CONTENT AREA
+        content_frame = ttk.Frame(main_container)
+        main_container.add(content_frame, weight=1)
+
+        # Top controls frame (Load File button + Filters)
+        top_controls_frame = ttk.Frame(content_frame)
+        top_controls_frame.pack(fill=tk.X, padx=10, pady=(5, 10))
+
+        # Load external file button
+        ttk.Button(top_controls_frame, text="Load External File", command=self.app.files.load_file, width=18).pack(side=tk.LEFT, padx=(0, 10))
+
+        # Scan a journal for errors, API warnings and performance problems
+        ttk.Button(top_controls_frame, text="Find Problems", command=self.app.files.analyze_journal, width=14).pack(side=tk.LEFT, padx=(0, 20))
+
+        # Journal Filters on the same row
+        ttk.Label(top_controls_frame, text="Category:").pack(side=tk.LEFT, padx=(0, 5))
+        self.app.journal_filter = ttk.Combobox(top_controls_frame, values=["All", *JOURNAL_CATEGORIES], state="readonly", width=12)
+        self.app.journal_filter.set("All")
+        self.app.journal_filter.pack(side=tk.LEFT, padx=(0, 10))
+        self.app.journal_filter.bind('<<ComboboxSelected>>', self.app.events.apply_journal_filter)
+
+        ttk.Label(top_controls_frame, text="Search:").pack(side=tk.LEFT, padx=(0, 5))
+        self.app.journal_search_var = tk.StringVar()
+        journal_search_entry = ttk.Entry(top_controls_frame, textvariable=self.app.journal_search_var, width=20)
+        journal_search_entry.pack(side=tk.LEFT, padx=(0, 10))
+        self.app.journal_search_var.trace_add('write', self.app.events.schedule_journal_filter)
+
+        ttk.Label(top_controls_frame, text="Time:").pack(side=tk.LEFT, padx=(0, 5))
+        self.app.time_range_var = tk.StringVar(value="All")
+        time_combo = ttk.Combobox(top_controls_frame, textvariable=self.app.time_range_var, values=["All", "Last 15 min", "Last 1 hour"], state="readonly", width=12)
+        time_combo.pack(side=tk.LEFT, padx=(0, 10))
+        # Filter once Tk is idle, so the combobox closes and repaints before the table is rebuilt
+        self.app.time_range_var.trace_add('write', lambda *args: self.root.after_idle(self.app.events.apply_journal_filter))
+
+        self.app.filter_selected_model_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(top_controls_frame, text="Filter by Model", variable=self.app.filter_selected_model_var, command=self.app.events.apply_journal_filter).pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Button(top_controls_frame, text="Clear", command=self.app.events.clear_text_filter).pack(side=tk.LEFT)
+
+        # Header Information
+        header_frame = ttk.LabelFrame(content_frame, text="Header Information")
+        header_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        self.app.header_vars = {
+            'build': tk.StringVar(value="Build: Unknown"),
+            'branch': tk.StringVar(value="Branch: Unknown"),
+            'release': tk.StringVar(value="Release: Unknown"),
+            'username': tk.StringVar(value="Username: Unknown")
+        }
+
+        for i, (key, var) in enumerate(self.app.header_vars.items()):
+            ttk.Label(header_frame, textvariable=var).grid(row=0, column=i, padx=5, pady=5, sticky="w")
+
+        # Model Selector
+        model_frame = ttk.LabelFrame(content_frame, text="Models")
+        model_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        ttk.Label(model_frame, text="Select Model:").pack(side=tk.LEFT, padx=5)
+        self.app.model_selector = ttk.Combobox(model_frame, state="readonly")
+        self.app.model_selector.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.app.model_selector.bind("<<ComboboxSelected>>", self.app.events.on_model_selected_event)
+
+        # Treeview for Journal Entries
+        tree_frame = ttk.Frame(content_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        self.app.journal_tree = ttk.Treeview(tree_frame, columns=("Timestamp", "Category", "Content"), show="headings")
+        self.app.journal_tree.heading("Timestamp", text="Timestamp")
+        self.app.journal_tree.heading("Category", text="Category")
+        self.app.journal_tree.heading("Content", text="Content")
+
+        self.app.journal_tree.column("Timestamp", width=150)
+        self.app.journal_tree.column("Category", width=100)
+        self.app.journal_tree.column("Content", width=500)
+
+        self.app.journal_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.app.journal_tree.yview)
+        self.app.journal_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Bind double-click for journal entry details
+        self.app.journal_tree.bind("<Double-1>", self.app.events.show_journal_entry_details)
+
+        # Journal Info Label
+        self.app.journal_info_label = ttk.Label(content_frame, text="No journal loaded.")
+        self.app.journal_info_label.pack(fill=tk.X, padx=10, pady=5)
+        
+        # Initialize journals tree on startup
+        self.refresh_journals_tree()
+
+    def load_selected_journal(self):
+        """Load the selected journal from the sidebar tree."""
+        selection = self.app.journals_tree.selection()
+        if not selection:
+            return
+        
+        item = selection[0]
+        # Check if it's a journal file (not a version folder)
+        parent = self.app.journals_tree.parent(item)
+        
+        if parent:  # It's a journal file
+            # Get the file path stored in the tree
+            file_path = self.app.journals_tree.item(item, "values")
+            if file_path and len(file_path) > 0:
+                self.app.files.load_journal_file(file_path[0])
+    
+    def refresh_journals_tree(self):
+        """Scan and refresh the journals tree."""
+        # Clear existing tree
+        self.app.journals_tree.delete(*self.app.journals_tree.get_children())
+        
+        # Scan for journals off the Tk thread; the tree is filled in when it finishes
+        placeholder = self.app.journals_tree.insert("", "end", text="Scanning for journals...", values=())
+        self._journals_refresh_id += 1
+        refresh_id = self._journals_refresh_id
+        self.app.files.run_in_background(
+            self._scan_journal_rows,
+            lambda rows_by_version: self._populate_journals_tree(rows_by_version, refresh_id, placeholder)
+        )
+
+    def _scan_journal_rows(self):
+        """
+        Scan for journals and build the tree labels; runs in the background I/O pool.
+        
+        Returns:
+            dict: Revit version -> list of (display text, journal path), newest first.
+        """
+        basename = os.path.basename
+        strftime, localtime = time.strftime, time.localtime
+        rows_by_version = {}
+        for version, journals in self.app.files.scan_revit_journals().items():
+            rows = rows_by_version[version] = []
+            for journal_path, mtime in journals:
+                # The modification time comes from the scan's directory entries, no stat here
+                mod_date = strftime(_JOURNAL_DATE_FORMAT, localtime(mtime))
+                rows.append((f"{basename(journal_path)} - {mod_date}", journal_path))
+        return rows_by_version
+
+    def _populate_journals_tree(self, rows_by_version, refresh_id, placeholder):
+        """
+        Fill the journals tree with the result of _scan_journal_rows.
+        
+        Rows are inserted a slice at a time so the window keeps responding while
+        hundreds of journals are added; the placeholder stays until the last slice.
+        """
+        if refresh_id != self._journals_refresh_id:
+            return
+        tree = self.app.journals_tree
+
+        if not rows_by_version:
+            tree.delete(placeholder)
+            tree.insert("", "end", text="No journals found", values=())
+            return
+        
+        self._journals_tree_step(self._journals_tree_inserts(rows_by_version), refresh_id, placeholder)
+
+    def _journals_tree_inserts(self, rows_by_version):
+        """Insert the journals tree rows, yielding after each one."""
+        insert = self.app.journals_tree.insert
+        for version, rows in rows_by_version.items():
+            # Add version as parent
+            version_node = insert("", "end", text=f"{version} ({len(rows)} journals)", values=())
+            yield
+            
+            # Add journals as children
+            for display_text, journal_path in rows:
+                insert(version_node, "end", text=display_text, values=(journal_path,))
+                yield
+
+    def _journals_tree_step(self, inserts, refresh_id, placeholder):
+        """Run one slice of journals tree inserts and schedule the next one when idle."""
+        if refresh_id != self._journals_refresh_id:
+            # Refreshed again meanwhile; the tree already belongs to the newer scan
+            return
+        done = 0
+        for _ in inserts:
+            done += 1
+            if done == _JOURNALS_TREE_CHUNK:
+                self.root.after_idle(self._journals_tree_step, inserts, refresh_id, placeholder)
+                return
+        self.app.journals_tree.delete(placeholder)
+
+    def setup_cleaning_tab(self, cleaning_tab):
+        """Setup the Cleaning tab with sidebar for version selection and cleaning operations."""
+
+        # Main container with sidebar and content area
+        main_container = ttk.PanedWindow(cleaning_tab, orient=tk.HORIZONTAL)
+        main_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # LEFT SIDEBAR - Revit versions and cleanable areas
+        sidebar_frame = ttk.Frame(main_container, width=350)
+        main_container.add(sidebar_frame, weight=0)
+
+        # Sidebar title
+        title_frame = ttk.Frame(sidebar_frame)
+        title_frame.pack(fill=tk.X, padx=5, pady=5)
+        ttk.Label(title_frame, text="Cleanable Areas", style="Bold.TLabel").pack(side=tk.LEFT)
+        ttk.Button(title_frame, text="🔄", command=self.refresh_cleaning_tree, width=3).pack(side=tk.RIGHT)
+
+        # Cleaning tree
+        cleaning_sidebar_frame = ttk.Frame(sidebar_frame)
+        cleaning_sidebar_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=(0, 5))
+
+        self.app.cleaning_tree = ttk.Treeview(cleaning_sidebar_frame, show="tree", selectmode="extended")
+        cleaning_scrollbar = ttk.Scrollbar(cleaning_sidebar_frame, orient=tk.VERTICAL, command=self.app.cleaning_tree.yview)
+        self.app.cleaning_tree.configure(yscrollcommand=cleaning_scrollbar.set)
+
+        self.app.cleaning_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        cleaning_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Bind selection event
+        self.app.cleaning_tree.bind("<<TreeviewSelect>>", self.on_cleaning_selection)
+
+        # RIGHT CONTENT AREA
+        content_frame = ttk.Frame(main_container)
+        main_container.add(content_frame, weight=1)
+
+        # Title area
+        ttk.Label(content_frame, text="Cleaning Details", style="Title.TLabel").pack(padx=10, pady=(10, 5))
+
+        # Details frame
+        details_frame = ttk.LabelFrame(content_frame, text="Selected Area Information", padding="10")
+        details_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        # Read-only text (paths stay selectable); long file lists scroll
+        self.app.cleaning_info_text = tk.Text(details_frame, height=15, wrap=tk.WORD, state=tk.DISABLED)
+        cleaning_info_scrollbar = ttk.Scrollbar(details_frame, orient=tk.VERTICAL, command=self.app.cleaning_info_text.yview)
+        self.app.cleaning_info_text.configure(yscrollcommand=cleaning_info_scrollbar.set)
+
+        self.app.cleaning_info_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        cleaning_info_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Action buttons frame
+        action_frame = ttk.Frame(content_frame)
+        action_frame.pack(fill=tk.X, padx=10, pady=10)
+
+        # Backup option
+        self.app.backup_before_clean = tk.BooleanVar(value=True)
+        ttk.Checkbutton(action_frame, text="💾 Backup before cleaning", variable=self.app.backup_before_clean).pack(side=tk.LEFT, padx=(0, 20))
+
+        # Action buttons
+        ttk.Button(action_frame, text="🗑️ Clean Selected", command=self.clean_selected_area, width=20).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(action_frame, text="🧹 Clean All (Version)", command=self.clean_all_version, width=20).pack(side=tk.RIGHT, padx=5)
+
+        # Status label
+        self.app.cleaning_status_label = ttk.Label(content_frame, text="Select an area to see details", foreground="gray")
+        self.app.cleaning_status_label.pack(fill=tk.X, padx=10, pady=(0, 10))
+
+        # Initialize cleaning tree on startup
+        self.refresh_cleaning_tree()
+    
+    def refresh_cleaning_tree(self):
+        """Scan and refresh the cleaning tree with all cleanable areas."""
+        # Clear existing tree
+        self.app.cleaning_tree.delete(*self.app.cleaning_tree.get_children())
+        # A refresh always rescans: the mtime fingerprint cannot see files growing
+        # inside the cache folders' subfolders
+        self.app.files.invalidate_cleanable_cache()
+
+        self._cleaning_scan_id += 1
+        scan_id = self._cleaning_scan_id
+
+        def on_progress(cleanable_data, area):
+            # Runs on the scanning thread; hand the update to the Tk event loop
+            self.app.files.call_in_tk(self._on_cleaning_progress, scan_id, cleanable_data, area)
+
+        def on_done(cleanable_data):
+            if scan_id != self._cleaning_scan_id:
+                return
+            if cleanable_data and self._cleaning_shown_scan_id == scan_id:
+                # Already shown, and updated area by area while the folders were sized
+                self.app.cleaning_status_label.config(text="Select an area to see details", foreground="gray")
+            else:
+                self._populate_cleaning_tree(cleanable_data)
+
+        # Scan for cleanable areas off the Tk thread; the areas are shown as soon as they
+        # are listed and the cache folder sizes are filled in as each walk finishes
+        self.app.cleaning_status_label.config(text="Scanning Revit installations...", foreground="gray")
+        self.app.files.run_in_background(lambda: self.app.files.scan_revit_cleanable_areas(on_progress), on_done)
+
+    def _on_cleaning_progress(self, scan_id, cleanable_data, area):
+        """Show a partial cleaning scan: the area list first, then each sized cache folder."""
+        if scan_id != self._cleaning_scan_id:
+            return
+        if area is None:
+            self._populate_cleaning_tree(cleanable_data)
+            self._cleaning_shown_scan_id = scan_id
+            if cleanable_data:
+                self.app.cleaning_status_label.config(text="Calculating folder sizes...", foreground="gray")
+        else:
+            self._update_cleaning_area(area)
+
+    def _populate_cleaning_tree(self, cleanable_data):
+        """Fill the cleaning tree with the result of scan_revit_cleanable_areas."""
+        tree = self.app.cleaning_tree
+        tree.delete(*tree.get_children())
+        self.app.cleaning_status_label.config(text="Select an area to see details", foreground="gray")
+        self._cleaning_detail_cache = {}
+        self._cleaning_version_nodes = {}
+        self._cleaning_area_items = {}
+        self._cleaning_item_keys = {}
+        self._cleaning_version_totals = {}
+        
+        # Store the data for later use
+        self.app.cleanable_data = cleanable_data
+
+        if not cleanable_data:
+            tree.insert("", "end", text="No Revit installations found")
+            return
+        
+        # Populate tree
+        for version, areas in cleanable_data.items():
+            # Add version as parent
+            self._sum_cleaning_version(version, areas)
+            version_node = tree.insert("", "end", text=self._cleaning_version_text(version, areas), tags=('version',))
+            self._cleaning_version_nodes[version] = version_node
+            self._cleaning_item_keys[version_node] = (version, None)
+            
+            # Add cleanable areas as children
+            for i, area in enumerate(areas):
+                area_text = f"{area['name']} - {area['description']}"
+                item = tree.insert(version_node, "end", text=area_text, tags=('area',))
+                self._cleaning_area_items[id(area)] = (item, version, i)
+                self._cleaning_item_keys[item] = (version, i)
+        
+        logger.info("Cleaning tree refreshed with %s Revit versions", len(cleanable_data))
+
+    def _cleaning_version_text(self, version, areas):
+        """Return the cleaning tree label of a version, with the totals of its areas."""
+        total_size, total_count = self._cleaning_version_totals[version]
+        return f"{version} ({len(areas)} areas, {total_count} items, {self.app.files._format_size(total_size)})"
+
+    def _sum_cleaning_version(self, version, areas):
+        """Store the total size and item count of a version's areas for its label and details."""
+        total_size = total_count = 0
+        for area in areas:
+            total_size += area['size']
+            total_count += area['count']
+        self._cleaning_version_totals[version] = (total_size, total_count)
+
+    def _update_cleaning_area(self, area):
+        """Refresh the row of an area whose folder size just became known, and its version totals."""
+        entry = self._cleaning_area_items.get(id(area))
+        if entry is None:
+            return
+        item, version, index = entry
+        tree = self.app.cleaning_tree
+        version_node = self._cleaning_version_nodes[version]
+        tree.item(item, text=f"{area['name']} - {area['description']}")
+        areas = self.app.cleanable_data[version]
+        self._sum_cleaning_version(version, areas)
+        tree.item(version_node, text=self._cleaning_version_text(version, areas))
+        
+        self._cleaning_detail_cache.pop((version, index), None)
+        self._cleaning_detail_cache.pop((version, None), None)
+        # Keep the details panel in step with a row the user is looking at
+        selection = tree.selection()
+        if selection and selection[0] in (item, version_node):
+            self.on_cleaning_selection(None)
+    
+    def on_cleaning_selection(self, event):
+        """Handle selection in the cleaning tree."""
+        selection = self.app.cleaning_tree.selection()
+        if not selection:
+            return
+        
+        # Get selected item; rows without a key (e.g. "No Revit installations found") show nothing
+        key = self._cleaning_item_keys.get(selection[0])
+        if key is None:
+            self._set_cleaning_info("")
+            return
+        
+        version, area_index = key
+        if area_index is None:  # It's a version
+            self.app.cleaning_status_label.config(text=f"Selected: {version}", foreground="blue")
+        else:  # It's a specific area
+            area = self.app.cleanable_data[version][area_index]
+            self.app.cleaning_status_label.config(text=f"Ready to clean: {area['name']}", foreground="orange")
+        
+        self._set_cleaning_info(self._cleaning_detail(version, area_index))
+
+    def _set_cleaning_info(self, info):
+        """Replace the text of the read-only cleaning details panel."""
+        text = self.app.cleaning_info_text
+        text.config(state=tk.NORMAL)
+        # One replace instead of a separate delete and insert
+        text.replace('1.0', tk.END, info)
+        text.config(state=tk.DISABLED)
+    
+    def _cleaning_detail(self, version, area_index):
+        """Return the details text of a version (area_index None) or one of its areas, cached per row."""
+        key = (version, area_index)
+        info = self._cleaning_detail_cache.get(key)
+        if info is None:
+            info = self._cleaning_detail_cache[key] = self._render_cleaning_detail(version, area_index)
+        return info
+
+    def _render_cleaning_detail(self, version, area_index):
+        """Build the details text shown in the cleaning tab for a version or one of its areas."""
+        format_size = self.app.files._format_size
+        areas = self.app.cleanable_data[version]
+        
+        if area_index is None:
+            total_size, total_count = self._cleaning_version_totals[version]
+            parts = [
+                f"📁 {version}\n\n",
+                f"Total cleanable areas: {len(areas)}\n",
+                f"Total items: {total_count}\n",
+                f"Total size: {format_size(total_size)}\n\n",
+                "Areas:\n",
+            ]
+            parts.extend(f"  • {area['name']}: {area['description']}\n" for area in areas)
+            return "".join(parts)
+        
+        area = areas[area_index]
+        parts = [
+            f"📋 {area['name']}\n\n",
+            f"Type: {area['type']}\n",
+            f"Path: {area['path']}\n",
+            f"Items: {area['count']}\n",
+            f"Size: {format_size(area['size'])}\n\n",
+            f"Description:\n{area['description']}\n\n",
+        ]
+        
+        if area['type'] == 'folder':
+            parts.append(f"\n⚠️ This will delete all files in:\n{area['path']}\n")
+        elif area['type'] == 'ini_section':
+            parts.append(f"\n⚠️ This will clear entries in:\n{area['path']}\n")
+        elif area['type'] == 'files':
+            files = area.get('files', [])
+            parts.append(f"\n⚠️ This will delete {len(area['files'])} files:\n")
+            parts.extend(f"  • {os.path.basename(f)}\n" for f in files[:10])  # Show first 10
+            if len(files) > 10:
+                parts.append(f"  ... and {len(files) - 10} more\n")
+        return "".join(parts)
+    
+    def clean_selected_area(self):
+        """Clean the selected area."""
+        # TODO: Implement cleaning logic
+        logger.info("Clean selected area - to be implemented")
+        self.app.files.invalidate_cleanable_cache()
+        if self.app.cleaning_status_label is not None:
+            self.app.cleaning_status_label.config(text="Cleaning functionality coming soon...", foreground="blue")
+    
+    def clean_all_version(self):
+        """Clean all areas for the selected version."""
+        # TODO: Implement cleaning logic
+        logger.info("Clean all version - to be implemented")
+        self.app.files.invalidate_cleanable_cache()
+        if self.app.cleaning_status_label is not None:
+            self.app.cleaning_status_label.config(text="Cleaning functionality coming soon...", foreground="blue")